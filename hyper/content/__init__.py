@@ -39,44 +39,39 @@ from hyper.content.loader import load
 from hyper.content.markdown import MarkdownCollection, MarkdownSingleton
 
 
+try:
+    from msgspec import Struct as _MsgspecStruct
+except ImportError:
+    _MsgspecStruct = None
+
+
+def _maybe_dataclassify(cls: type) -> None:
+    """Apply @dataclass in-place unless cls is pydantic, msgspec, or already a dataclass."""
+    # Pydantic propagates model_fields to subclasses, so one lookup covers the MRO
+    if hasattr(cls, "model_fields") or hasattr(cls, "__dataclass_fields__"):
+        return
+    if _MsgspecStruct is not None and issubclass(cls, _MsgspecStruct):
+        return
+
+    from dataclasses import dataclass as apply_dataclass
+
+    # Apply dataclass and copy methods back to original class
+    dc_cls = apply_dataclass(cls)
+    cls.__init__ = dc_cls.__init__
+    cls.__repr__ = dc_cls.__repr__
+    cls.__eq__ = dc_cls.__eq__
+    cls.__dataclass_fields__ = dc_cls.__dataclass_fields__
+    if hasattr(dc_cls, "__dataclass_params__"):
+        cls.__dataclass_params__ = dc_cls.__dataclass_params__
+
+
 # Bare base classes - combine with pydantic.BaseModel, msgspec.Struct, or @dataclass
 class Singleton(SingletonMixin):
     """Singleton model - combine with pydantic.BaseModel, msgspec.Struct, or @dataclass."""
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-
-        # Check if pydantic or msgspec is being used
-        has_pydantic = any(hasattr(base, "model_fields") for base in cls.__mro__)
-
-        # Check if msgspec.Struct is actually in the inheritance chain
-        has_msgspec = False
-        try:
-            import msgspec
-
-            has_msgspec = any(
-                isinstance(base, type) and issubclass(base, msgspec.Struct)
-                for base in cls.__mro__
-            )
-        except ImportError:
-            pass
-
-        # If not pydantic/msgspec and not already a dataclass, apply @dataclass in-place
-        if (
-            not has_pydantic
-            and not has_msgspec
-            and not hasattr(cls, "__dataclass_fields__")
-        ):
-            from dataclasses import dataclass as apply_dataclass
-
-            # Apply dataclass and copy methods back to original class
-            dc_cls = apply_dataclass(cls)
-            cls.__init__ = dc_cls.__init__
-            cls.__repr__ = dc_cls.__repr__
-            cls.__eq__ = dc_cls.__eq__
-            cls.__dataclass_fields__ = dc_cls.__dataclass_fields__
-            if hasattr(dc_cls, "__dataclass_params__"):
-                cls.__dataclass_params__ = dc_cls.__dataclass_params__
+        _maybe_dataclassify(cls)
 
 
 class Collection(CollectionMixin):
@@ -84,38 +79,7 @@ class Collection(CollectionMixin):
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-
-        # Check if pydantic or msgspec is being used
-        has_pydantic = any(hasattr(base, "model_fields") for base in cls.__mro__)
-
-        # Check if msgspec.Struct is actually in the inheritance chain
-        has_msgspec = False
-        try:
-            import msgspec
-
-            has_msgspec = any(
-                isinstance(base, type) and issubclass(base, msgspec.Struct)
-                for base in cls.__mro__
-            )
-        except ImportError:
-            pass
-
-        # If not pydantic/msgspec and not already a dataclass, apply @dataclass in-place
-        if (
-            not has_pydantic
-            and not has_msgspec
-            and not hasattr(cls, "__dataclass_fields__")
-        ):
-            from dataclasses import dataclass as apply_dataclass
-
-            # Apply dataclass and copy methods back to original class
-            dc_cls = apply_dataclass(cls)
-            cls.__init__ = dc_cls.__init__
-            cls.__repr__ = dc_cls.__repr__
-            cls.__eq__ = dc_cls.__eq__
-            cls.__dataclass_fields__ = dc_cls.__dataclass_fields__
-            if hasattr(dc_cls, "__dataclass_params__"):
-                cls.__dataclass_params__ = dc_cls.__dataclass_params__
+        _maybe_dataclassify(cls)
 
 
 # Build __all__
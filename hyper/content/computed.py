@@ -6,6 +6,8 @@ from typing import Any, Callable, TypeVar
 
 T = TypeVar("T")
 
+_MISSING = object()
+
 
 def computed(func: Callable[[Any], T]) -> property:
     """Decorator for computed/derived fields that are lazily evaluated.
@@ -34,11 +36,18 @@ def computed(func: Callable[[Any], T]) -> property:
 
     @wraps(func)
     def getter(self):
-        # Check if already computed
-        if not hasattr(self, cache_attr):
-            # Compute and cache
-            result = func(self)
-            setattr(self, cache_attr, result)
-        return getattr(self, cache_attr)
+        try:
+            cache = self.__dict__
+        except AttributeError:
+            # No instance dict (e.g. __slots__), fall back to attribute access
+            if not hasattr(self, cache_attr):
+                setattr(self, cache_attr, func(self))
+            return getattr(self, cache_attr)
+
+        # Single dict lookup on the hot path
+        result = cache.get(cache_attr, _MISSING)
+        if result is _MISSING:
+            result = cache[cache_attr] = func(self)
+        return result
 
     return property(getter)
@@ -23,19 +23,39 @@ class Converter(Protocol):
 
 
 # Import and register all converters
-from hyper.content.converters.pydantic import PydanticConverter  # noqa: E402
-from hyper.content.converters.msgspec import MsgspecConverter  # noqa: E402
 from hyper.content.converters.dataclass import DataclassConverter  # noqa: E402
 from hyper.content.converters.primitives import PrimitiveConverter  # noqa: E402
 
 # Converter registry - order matters! First match wins
-CONVERTERS: list[type[Converter]] = [
-    PydanticConverter,  # Pydantic first (matches base class priority)
-    MsgspecConverter,  # Msgspec second
+CONVERTERS: list[type[Converter]] = []
+
+# Optional converters are only registered when their library is installed
+try:
+    from hyper.content.converters.pydantic import PydanticConverter
+
+    CONVERTERS.append(PydanticConverter)  # Pydantic first (matches base class priority)
+except ImportError:
+    pass
+
+try:
+    from hyper.content.converters.msgspec import MsgspecConverter
+
+    CONVERTERS.append(MsgspecConverter)  # Msgspec second
+except ImportError:
+    pass
+
+CONVERTERS += [
     DataclassConverter,  # Standard library dataclasses
     PrimitiveConverter,  # Primitives (int, str, etc)
 ]
 
+# Resolved converter per target type, valid for the CONVERTERS snapshot below
+_DISPATCH: dict[Any, type[Converter]] = {}
+_converters_snapshot: tuple[type[Converter], ...] = ()
+
+# _DISPATCH keeps every type it sees alive, so it is capped
+_DISPATCH_MAX = 256
+
 
 def convert(data: Any, target_type: type, is_list: bool) -> Any:
     """Convert data using registered converters.
@@ -51,14 +71,27 @@ def convert(data: Any, target_type: type, is_list: bool) -> Any:
     Raises:
         TypeError: If no converter can handle the target type
     """
-    for converter_cls in CONVERTERS:
-        if converter_cls.can_convert(target_type):
-            if is_list:
-                return converter_cls.convert_list(data, target_type)
-            else:
-                return converter_cls.convert_single(data, target_type)
-
-    raise TypeError(
-        f"No converter available for {target_type}. "
-        f"Install msgspec or pydantic, or register a custom converter."
-    )
+    global _converters_snapshot
+    converters = tuple(CONVERTERS)
+    if converters != _converters_snapshot:
+        # A converter was registered or removed since the lookups were cached
+        _DISPATCH.clear()
+        _converters_snapshot = converters
+
+    converter_cls = _DISPATCH.get(target_type)
+    if converter_cls is None:
+        for candidate in converters:
+            if candidate.can_convert(target_type):
+                if len(_DISPATCH) >= _DISPATCH_MAX:
+                    _DISPATCH.clear()
+                converter_cls = _DISPATCH[target_type] = candidate
+                break
+        else:
+            raise TypeError(
+                f"No converter available for {target_type}. "
+                f"Install msgspec or pydantic, or register a custom converter."
+            )
+
+    if is_list:
+        return converter_cls.convert_list(data, target_type)
+    return converter_cls.convert_single(data, target_type)
@@ -2,6 +2,23 @@
 
 from typing import Any
 
+# Field names per dataclass, computed once per type
+_FIELDS_CACHE: dict[type, frozenset[str]] = {}
+
+# _FIELDS_CACHE keeps every type it sees alive, so it is capped
+_FIELDS_CACHE_MAX = 256
+
+
+def _get_fields(target_type: type) -> frozenset[str]:
+    fields = _FIELDS_CACHE.get(target_type)
+    if fields is None:
+        if len(_FIELDS_CACHE) >= _FIELDS_CACHE_MAX:
+            _FIELDS_CACHE.clear()
+        fields = _FIELDS_CACHE[target_type] = frozenset(
+            target_type.__dataclass_fields__
+        )
+    return fields
+
 
 class DataclassConverter:
     """Converter for standard library dataclasses (always available)."""
@@ -15,14 +32,18 @@ class DataclassConverter:
     @staticmethod
     def convert_single(data: dict, target_type: type) -> Any:
         # Filter to only fields that exist in the dataclass
-        fields = set(target_type.__dataclass_fields__.keys())
-        filtered = {k: v for k, v in data.items() if k in fields}
-        return target_type(**filtered)
+        fields = _get_fields(target_type)
+        if data.keys() <= fields:
+            return target_type(**data)
+        return target_type(**{k: data[k] for k in data.keys() & fields})
 
     @staticmethod
     def convert_list(data: list[dict], target_type: type) -> list[Any]:
-        fields = set(target_type.__dataclass_fields__.keys())
+        fields = _get_fields(target_type)
+        # Skip filtering for items whose keys already match the schema
         return [
-            target_type(**{k: v for k, v in item.items() if k in fields})
+            target_type(**item)
+            if item.keys() <= fields
+            else target_type(**{k: item[k] for k in item.keys() & fields})
             for item in data
         ]
@@ -2,18 +2,15 @@
 
 from typing import Any
 
+from pydantic import BaseModel
+
 
 class PydanticConverter:
     """Converter for pydantic.BaseModel (install with: uv add hyper[pydantic])."""
 
     @staticmethod
     def can_convert(target_type: Any) -> bool:
-        try:
-            from pydantic import BaseModel
-
-            return isinstance(target_type, type) and issubclass(target_type, BaseModel)
-        except ImportError:
-            return False
+        return isinstance(target_type, type) and issubclass(target_type, BaseModel)
 
     @staticmethod
     def convert_single(data: dict, target_type: type) -> Any:
@@ -1,44 +1,66 @@
 import glob
+import os
 from pathlib import Path
 from typing import Any, TypeVar, get_args, get_origin, overload
 
 from hyper.content.converters import convert
-from hyper.content.parsers import parse_file
+from hyper.content.parsers import _read_all_bytes, parse_file
 
 T = TypeVar("T")
 
 
-def deep_merge(base: dict, override: dict) -> dict:
-    """Recursively merge two dictionaries."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+def _deep_merge_into(target: dict, override: dict) -> None:
+    """Recursively merge override into target, mutating target and its nested dicts.
+
+    Only safe when the caller owns target (e.g. freshly parsed file data).
+    """
+    # Explicit worklist: no frame per nesting level and no recursion limit
+    stack = [(target, override)]
+    while stack:
+        target, override = stack.pop()
+        # No nested dict on either side: one C-level update does the whole level
+        if not any(isinstance(value, dict) for value in override.values()):
+            target.update(override)
+            continue
+        for key, value in override.items():
+            current = target.get(key)
+            # isinstance, so dict subclasses returned by hooks merge too
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
 
 
-def inject_metadata(data: Any, path: Path) -> None:
-    """Inject metadata into loaded data (only for dicts)."""
+def inject_metadata(data: Any, path: str | Path, cwd: str | None = None) -> None:
+    """Inject metadata into loaded data (only for dicts).
+
+    Pass a pre-resolved ``cwd`` when tagging many files to avoid resolving it per file.
+    """
     if isinstance(data, dict):
         if "id" not in data:
             # Use relative path from cwd, with extension removed
             # E.g., "docs/guides/getting-started.md" → "docs/guides/getting-started"
-            try:
-                # Resolve both paths to handle symlinks (e.g., /tmp → /private/tmp on macOS)
-                resolved_path = path.resolve()
-                resolved_cwd = Path.cwd().resolve()
-                rel_path = resolved_path.relative_to(resolved_cwd)
-                # Remove extension and convert to forward slashes
-                data["id"] = str(rel_path.with_suffix(""))
-            except ValueError:
+            # Resolve both paths to handle symlinks (e.g., /tmp → /private/tmp on macOS)
+            resolved_path = os.path.realpath(path)
+            resolved_cwd = cwd if cwd is not None else os.path.realpath(os.getcwd())
+            prefix = os.path.join(resolved_cwd, "")
+            if os.path.normcase(resolved_path).startswith(os.path.normcase(prefix)):
+                # Remove extension
+                data["id"] = os.path.splitext(resolved_path[len(prefix) :])[0]
+            else:
                 # If path is not relative to cwd, just use stem
-                data["id"] = path.stem
+                data["id"] = os.path.splitext(os.path.basename(path))[0]
     elif isinstance(data, list):
         for item in data:
             if isinstance(item, dict) and "_source" not in item:
-                item["_source"] = path.name
+                item["_source"] = os.path.basename(path)
+
+
+def _inject_metadata_many(items: list[Any], paths: list[str], cwd: str) -> None:
+    """Inject metadata into a batch of parsed files, pairing items with paths by index."""
+    inject = inject_metadata
+    for item, path in zip(items, paths):
+        inject(item, path, cwd)
 
 
 # ==========================================
@@ -79,14 +101,19 @@ class Loader:
     ) -> Any:
         origin = get_origin(type_hint)
 
+        # Literal paths skip globbing entirely: one stat instead of a directory walk
+        if not glob.has_magic(pattern):
+            if not os.path.exists(pattern):
+                raise FileNotFoundError(f"File not found: {pattern}")
+            matches = [pattern]
+        else:
+            matches = glob.glob(pattern, recursive=True)
+
         # No type hint? Return raw data (no conversion)
         if type_hint is None:
-            paths = [Path(p) for p in glob.glob(pattern, recursive=True)]
-            if not paths and not glob.has_magic(pattern):
-                raise FileNotFoundError(f"File not found: {pattern}")
-            if len(paths) == 1:
-                return parse_file(paths[0])
-            return [parse_file(p) for p in paths]
+            if len(matches) == 1:
+                return parse_file(matches[0])
+            return [parse_file(path) for path in matches]
 
         # Determine collection vs singleton
         is_collection = origin is list
@@ -101,43 +128,68 @@ class Loader:
             after_parse_hook = getattr(model_cls.Meta, "after_parse", None)
             after_load_hook = getattr(model_cls.Meta, "after_load", None)
 
-        # Load files
-        paths = sorted([Path(p) for p in glob.glob(pattern, recursive=True)])
-        if not paths and not glob.has_magic(pattern):
-            raise FileNotFoundError(f"File not found: {pattern}")
-
-        # Parse to dict/list, then convert
-        raw_items = []
-        for path in paths:
-            # Apply before_parse hook if present
-            raw_bytes = path.read_bytes()
-            if before_parse_hook:
-                raw_bytes = before_parse_hook(path, raw_bytes)
-
-            # Singleton optimization: For single file, try direct parsing to target type
-            if not is_collection and len(paths) == 1:
-                try:
-                    result = parse_file(path, target_type=model_cls, content=raw_bytes)
-                    # If parser returned the target type directly (optimization worked)
-                    if not isinstance(result, (dict, list)):
-                        inject_metadata(result, path)
-                        # For msgspec direct parse, __init__ wasn't called, so run after_load manually
-                        if after_load_hook:
-                            result = after_load_hook(result)
-                        return result
-                except (TypeError, AttributeError):
-                    # Optimization didn't work, fall through to normal parsing
-                    pass
-
-            # Parse the (possibly modified) bytes
-            content = parse_file(path, content=raw_bytes)
-
-            # Apply after_parse hook if present
-            if after_parse_hook:
-                content = after_parse_hook(path, content)
-
-            inject_metadata(content, path)
-            raw_items.append(content)
+        # Load files (plain strings; hooks are the only consumers of Path objects)
+        matches.sort()
+        paths = matches
+
+        # Resolve cwd once for the whole batch (used for id injection)
+        cwd = os.path.realpath(os.getcwd())
+
+        # Specialize the per-file pipeline once, so the loop never re-checks hooks
+        if before_parse_hook:
+
+            def read_one(path: str) -> bytes:
+                return before_parse_hook(Path(path), _read_all_bytes(path))
+
+            def parse_one(path: str) -> Any:
+                return parse_file(path, content=read_one(path))
+
+        else:
+            read_one = _read_all_bytes
+            # parse_file reads the file itself (and can mmap large ones)
+            parse_one = parse_file
+
+        if after_parse_hook:
+
+            def finish_one(path: str, content: Any) -> Any:
+                return after_parse_hook(Path(path), content)
+
+            def load_one(path: str) -> Any:
+                return finish_one(path, parse_one(path))
+
+        else:
+
+            def finish_one(path: str, content: Any) -> Any:
+                return content
+
+            load_one = parse_one
+
+        # Singleton optimization: For single file, try direct parsing to target type.
+        # Parsers without direct support return plain data, which is used as-is
+        # rather than parsing the same bytes a second time.
+        if not is_collection and len(paths) == 1:
+            path = paths[0]
+            raw_bytes = read_one(path)
+            try:
+                content = parse_file(path, target_type=model_cls, content=raw_bytes)
+            except (TypeError, AttributeError):
+                # Optimization didn't work, fall back to normal parsing
+                content = parse_file(path, content=raw_bytes)
+
+            # If parser returned the target type directly (optimization worked)
+            if not isinstance(content, (dict, list)):
+                inject_metadata(content, path, cwd)
+                # For msgspec direct parse, __init__ wasn't called, so run after_load manually
+                if after_load_hook:
+                    content = after_load_hook(content)
+                return content
+            raw_items = [finish_one(path, content)]
+        else:
+            # Parse to dict/list, then convert
+            raw_items = [load_one(path) for path in paths]
+
+        # Tag the whole batch in one pass once parsing is done
+        _inject_metadata_many(raw_items, paths, cwd)
 
         if not raw_items and is_collection:
             return []
@@ -176,7 +228,7 @@ class Loader:
                             f"Cannot merge lists into a Singleton {model_cls.__name__}"
                         )
                     if merge == "deep":
-                        final_data = deep_merge(final_data, item)
+                        _deep_merge_into(final_data, item)
                     else:  # shallow
                         final_data.update(item)
             else:
@@ -1,6 +1,9 @@
 """URL-based loader for fetching content from HTTP endpoints."""
 
+import json
 from typing import Any
+from urllib.parse import urlparse
+from urllib.request import urlopen
 
 
 def load_from_url(url: str) -> list[dict[str, Any]]:
@@ -13,16 +16,8 @@ def load_from_url(url: str) -> list[dict[str, Any]]:
         List of dicts to be converted to typed instances
 
     Raises:
-        ImportError: If urllib is not available
         ValueError: If response is not valid JSON or URL scheme is not allowed
     """
-    try:
-        from urllib.request import urlopen
-        from urllib.parse import urlparse
-        import json
-    except ImportError as e:
-        raise ImportError("urllib is required for URL-based loading") from e
-
     # Validate URL scheme to prevent file:// and other unexpected protocols
     parsed = urlparse(url)
     if parsed.scheme not in ("http", "https"):
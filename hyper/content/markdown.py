@@ -1,7 +1,8 @@
 """Markdown support for content collections."""
 
+import re
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any
 
 try:
@@ -19,6 +20,12 @@ except ImportError:
     HAS_MSGSPEC = False
     msgspec = None
 
+# Slug cleanup
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
+_FORMAT_RE = re.compile(r"[*_~`]")
+_NONWORD_RE = re.compile(r"[^\w\s-]")
+_DASH_RE = re.compile(r"[-\s]+")
+
 
 @dataclass
 class Heading:
@@ -86,16 +93,26 @@ class _MarkdownMixin:
     @cached_property
     def headings(self) -> list[Heading]:
         """Extract headings from markdown content."""
-        import re
-
         headings_list = []
-        atx_pattern = re.compile(r"^(#{1,6})\s+(.+?)(?:\s+#{1,6})?\s*$", re.MULTILINE)
 
-        for match in atx_pattern.finditer(self.body):
-            level = len(match.group(1))
-            text = match.group(2).strip()
-            slug = _slugify(text)
-            headings_list.append(Heading(level, text, slug))
+        # Only lines starting with "#" can be ATX headings, so skip the rest cheaply
+        for line in self.body.split("\n"):
+            if not line.startswith("#"):
+                continue
+            rest = line.lstrip("#")
+            level = len(line) - len(rest)
+            if level > 6 or not rest[:1].isspace():
+                continue
+            text = rest.strip()
+            if not text:
+                continue
+
+            # Drop an optional closing sequence: "## Title ##"
+            trimmed = text.rstrip("#")
+            if trimmed and trimmed[-1].isspace() and len(text) - len(trimmed) <= 6:
+                text = trimmed.rstrip()
+
+            headings_list.append(Heading(level, text, _slugify(text)))
 
         return headings_list
 
@@ -105,18 +122,20 @@ class _MarkdownMixin:
         return TOC(self.headings)
 
 
+@lru_cache(maxsize=4096)
 def _slugify(text: str) -> str:
-    """Convert text to URL-friendly slug."""
-    import re
+    """Convert text to URL-friendly slug.
 
+    Cached process-wide, since headings like "Installation" repeat across documents.
+    """
     # Remove markdown formatting
-    text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)  # Links
-    text = re.sub(r"[*_~`]", "", text)  # Bold, italic, code
+    text = _LINK_RE.sub(r"\1", text)  # Links
+    text = _FORMAT_RE.sub("", text)  # Bold, italic, code
 
     # Convert to lowercase and replace spaces/special chars with hyphens
     text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
+    text = _NONWORD_RE.sub("", text)
+    text = _DASH_RE.sub("-", text)
     text = text.strip("-")
 
     return text
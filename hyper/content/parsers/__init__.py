@@ -1,5 +1,7 @@
 """File format parsers with protocol-based extensibility."""
 
+import mmap
+import os
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -30,18 +32,100 @@ from hyper.content.parsers.markdown import MarkdownParser  # noqa: E402
 from hyper.content.parsers.toml import TomlParser  # noqa: E402
 from hyper.content.parsers.yaml import YamlParser  # noqa: E402
 
+# Only one JSON parser is registered: msgspec beats stdlib json whenever it's installed
+try:
+    import msgspec.json  # noqa: F401
+
+    _JsonParser: type[Parser] = MsgspecJsonParser
+except ImportError:
+    _JsonParser = StdlibJsonParser
+
 # Parser registry - order matters! First match wins
 PARSERS: list[type[Parser]] = [
-    MsgspecJsonParser,  # Try msgspec first for JSON (fastest)
-    StdlibJsonParser,  # Fallback to stdlib JSON
+    _JsonParser,  # JSON (msgspec, or stdlib fallback)
     YamlParser,  # YAML support
     TomlParser,  # TOML support
     MarkdownParser,  # Markdown with frontmatter
 ]
 
 
+# Chunk size for reads that can't be sized up front
+_READ_CHUNK_SIZE = 1 << 20
+
+# Files above this size are memory-mapped for parsers that accept any buffer
+_MMAP_THRESHOLD = 2 << 20
+
+# Parsers whose parse() works on a memoryview as well as bytes
+_BUFFER_PARSERS: set[type[Parser]] = {MsgspecJsonParser}
+
+
+def _read_all_bytes(
+    path: str | Path, allow_mmap: bool = False
+) -> bytes | memoryview:
+    """Read a whole file with os.open/os.read, skipping BufferedReader setup.
+
+    With allow_mmap, large files come back as a read-only memoryview over an
+    mmap instead, so the parser reads straight from the page cache.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        if allow_mmap and size > _MMAP_THRESHOLD:
+            # mmap keeps its own handle, so closing fd below is fine
+            return memoryview(mmap.mmap(fd, 0, access=mmap.ACCESS_READ))
+        data = os.read(fd, size)
+        if len(data) < size or size == 0:
+            # Short read or unsized file (e.g. procfs): keep reading unbuffered
+            chunks = [data]
+            while chunk := os.read(fd, _READ_CHUNK_SIZE):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+# Built-in parsers decide on the file suffix alone. Custom parsers may look at
+# the whole path, so their answers can't be cached per suffix.
+_SUFFIX_PARSERS: frozenset[type[Parser]] = frozenset(
+    {MsgspecJsonParser, StdlibJsonParser, YamlParser, TomlParser, MarkdownParser}
+)
+
+# Parser chosen per (lowercased) file suffix, valid for the PARSERS snapshot below
+_PARSER_BY_SUFFIX: dict[str, type[Parser]] = {}
+_parsers_snapshot: tuple[type[Parser], ...] = ()
+
+
+def _find_parser(path: str | Path) -> type[Parser] | None:
+    """Return the first registered parser for this file.
+
+    A match is cached by suffix when it and every parser ahead of it are
+    built-ins. The cache is dropped whenever PARSERS changes.
+    """
+    global _parsers_snapshot
+    parsers = tuple(PARSERS)
+    if parsers != _parsers_snapshot:
+        _PARSER_BY_SUFFIX.clear()
+        _parsers_snapshot = parsers
+
+    suffix = os.path.splitext(path)[1].lower()
+    parser = _PARSER_BY_SUFFIX.get(suffix)
+    if parser is not None:
+        return parser
+
+    path = Path(path)
+    cacheable = True
+    for parser in parsers:
+        if parser.can_parse(path):
+            if cacheable and parser in _SUFFIX_PARSERS:
+                _PARSER_BY_SUFFIX[suffix] = parser
+            return parser
+        cacheable = cacheable and parser in _SUFFIX_PARSERS
+    return None
+
+
 def parse_file(
-    path: Path, target_type: type | None = None, content: bytes | None = None
+    path: str | Path, target_type: type | None = None, content: bytes | None = None
 ) -> Any:
     """Parse a file using the first available parser.
 
@@ -56,19 +140,15 @@ def parse_file(
     Raises:
         ValueError: If no parser can handle this file type
     """
+    parser = _find_parser(path)
+    if parser is None:
+        raise ValueError(
+            f"Unsupported file extension '{Path(path).suffix}' in {os.path.basename(path)}. "
+            f"Supported formats: .json, .yaml, .yml, .toml, .md, .markdown"
+        )
+
     if content is None:
-        content = path.read_bytes()
+        content = _read_all_bytes(path, allow_mmap=parser in _BUFFER_PARSERS)
 
-    for parser in PARSERS:
-        if parser.can_parse(path):
-            # Try parsing with target_type if parser supports it
-            try:
-                return parser.parse(content, target_type)
-            except TypeError:
-                # Parser doesn't accept target_type, try without it
-                return parser.parse(content)
-
-    raise ValueError(
-        f"Unsupported file extension '{path.suffix}' in {path.name}. "
-        f"Supported formats: .json, .yaml, .yml, .toml, .md, .markdown"
-    )
+    # Every parser accepts target_type (see the Parser protocol)
+    return parser.parse(content, target_type)
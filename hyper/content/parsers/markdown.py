@@ -4,6 +4,14 @@ from pathlib import Path
 
 import markdown as md_lib
 
+try:
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it (much faster than pure Python)
+    _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    yaml = None
+
 
 class MarkdownParser:
     """Markdown parser with optional YAML frontmatter."""
@@ -14,29 +22,25 @@ class MarkdownParser:
 
     @staticmethod
     def parse(content: bytes, target_type: type | None = None) -> dict:
-        text = content.decode("utf-8")
-
-        # Try to parse frontmatter if present
-        if text.startswith("---"):
-            try:
-                import yaml
-
-                _, frontmatter, body = text.split("---", 2)
-                data = yaml.safe_load(frontmatter) or {}
-                markdown_content = body.strip()
-                data["body"] = markdown_content
-                data["html"] = md_lib.markdown(markdown_content)
-                return data
-            except ValueError:
-                # If split fails, treat as regular markdown
-                pass
-            except ImportError:
+        # Try to parse frontmatter if present. Delimiters are located on the raw
+        # bytes so only the body gets decoded (YAML reads the bytes directly).
+        if content.startswith(b"---"):
+            if yaml is None:
                 raise ImportError(
                     "YAML frontmatter requires PyYAML. Install with: uv add pyyaml"
                 )
+            # Same split as text.split("---", 2): the next "---" anywhere closes it
+            end = content.find(b"---", 3)
+            if end != -1:
+                frontmatter = content[3:end]
+                data = yaml.load(frontmatter, Loader=_SafeLoader) or {}  # nosec B506 - safe loader
+                markdown_content = content[end + 3 :].decode("utf-8").strip()
+                data["body"] = markdown_content
+                data["html"] = md_lib.markdown(markdown_content)
+                return data
 
-        # No frontmatter or failed to parse
-        markdown_content = text.strip()
+        # No frontmatter or no closing delimiter: treat as regular markdown
+        markdown_content = content.decode("utf-8").strip()
         return {
             "body": markdown_content,
             "html": md_lib.markdown(markdown_content),
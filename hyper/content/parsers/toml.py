@@ -1,5 +1,6 @@
 """TOML parser using standard library."""
 
+import tomllib
 from pathlib import Path
 from typing import Any
 
@@ -13,7 +14,5 @@ class TomlParser:
 
     @staticmethod
     def parse(content: bytes, target_type: type | None = None) -> Any:
-        import tomllib
-
         # tomllib always returns dict, no optimization possible
         return tomllib.loads(content.decode("utf-8"))
@@ -3,6 +3,14 @@
 from pathlib import Path
 from typing import Any
 
+try:
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it (much faster than pure Python)
+    _SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    yaml = None
+
 
 class YamlParser:
     """YAML parser using PyYAML."""
@@ -13,12 +21,10 @@ class YamlParser:
 
     @staticmethod
     def parse(content: bytes, target_type: type | None = None) -> Any:
-        try:
-            import yaml
-
-            # PyYAML always returns dict, no optimization possible
-            return yaml.safe_load(content)
-        except ImportError:
+        if yaml is None:
             raise ImportError(
                 "YAML support requires PyYAML. Install with: uv add pyyaml"
             )
+
+        # PyYAML always returns dict, no optimization possible
+        return yaml.load(content, Loader=_SafeLoader)  # nosec B506 - safe loader
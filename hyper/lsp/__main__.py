@@ -5,8 +5,7 @@ Usage:
     python -m hyper.lsp
 """
 
-import asyncio
-from .server import main
+from .server import run
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    run()
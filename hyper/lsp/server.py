@@ -15,26 +15,186 @@ Based on templ's LSP architecture:
 """
 
 import asyncio
+import atexit
+import hashlib
 import json
 import logging
+import logging.handlers
 import os
-import subprocess
 import sys
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, Optional
+from queue import SimpleQueue
+from typing import Any
 from urllib.parse import urlparse, unquote
 
 from .sourcemap import SourceMap, Position
 from .transformer import transform, TransformResult
 
-# Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.FileHandler('/tmp/hyper-lsp.log'), logging.StreamHandler()]
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Set up logging: warnings to stderr by default. HYPER_LSP_LOG=1 turns on DEBUG
+# logging to /tmp/hyper-lsp.log, written by a listener thread so file I/O never
+# blocks the event loop.
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+if os.environ.get('HYPER_LSP_LOG'):
+    _log_queue: SimpleQueue = SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue, logging.FileHandler('/tmp/hyper-lsp.log'), logging.StreamHandler()
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format=LOG_FORMAT,
+        handlers=[logging.handlers.QueueHandler(_log_queue)],
+    )
+else:
+    logging.basicConfig(level=logging.WARNING, format=LOG_FORMAT)
+
 logger = logging.getLogger('hyper-lsp')
 
+HEADER_END = b'\r\n\r\n'
+
+# JSON containers that may hold positions
+CONTAINER_TYPES = (dict, list)
+
+# Language features answered by Pyright
+PROXIED_METHODS = (
+    'textDocument/completion',
+    'textDocument/hover',
+    'textDocument/definition',
+    'textDocument/references',
+    'textDocument/documentSymbol',
+)
+
+# Seconds to wait for more edits before forwarding didChange to Pyright
+CHANGE_FLUSH_DELAY = 0.015
+
+# Number of recent transform results kept for reuse
+TRANSFORM_CACHE_SIZE = 64
+
+# Seconds to wait for a Pyright response before giving up on the request
+PYRIGHT_REQUEST_TIMEOUT = 10.0
+
+
+def _encode_message(message: dict) -> tuple[bytes, bytes]:
+    """Frame a JSON-RPC message as (header, body) for a single writelines() call.
+
+    Keeping the parts separate avoids copying the body just to prepend the
+    header; transports with vectored I/O send both in one syscall.
+    """
+    if orjson is not None:
+        content = orjson.dumps(message)
+    else:
+        content = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    # Content-Length counts bytes, not characters
+    return b'Content-Length: %d\r\n\r\n' % len(content), content
+
+
+def _decode_message(content: bytes | memoryview) -> dict:
+    """Parse a JSON-RPC body straight from bytes (no intermediate str)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(bytes(content))
+
+
+def _content_length(headers: bytes) -> int:
+    """Extract Content-Length from a raw header block (0 if missing or invalid)."""
+    for line in headers.split(b'\r\n'):
+        key, sep, value = line.partition(b':')
+        if sep and key.strip().lower() == b'content-length':
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+    return 0
+
+
+# Smallest free space offered to the transport for each read
+MIN_READ_SIZE = 64 * 1024
+
+
+class LspReaderProtocol(asyncio.BufferedProtocol):
+    """
+    Parses LSP frames from the editor's stdin into a queue of messages.
+
+    Data lands in one growable buffer (directly, on transports that support
+    buffered reads) and bodies are decoded from a view of it, instead of going
+    through a StreamReader buffer and a copy per readexactly(). None is queued
+    at EOF, and for a frame without a Content-Length, which ends the session.
+    """
+
+    def __init__(self, queue: asyncio.Queue):
+        self._queue = queue
+        self._buffer = bytearray(MIN_READ_SIZE)
+        self._start = 0  # First byte not yet parsed
+        self._end = 0  # End of received data
+        self._closed = False  # Set once None is queued
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        # Move a partial frame to the front, then make room for the next read.
+        # Only safe here: no view of the buffer is alive between reads.
+        if self._start:
+            pending = self._end - self._start
+            self._buffer[:pending] = self._buffer[self._start:self._end]
+            self._start, self._end = 0, pending
+        if len(self._buffer) - self._end < max(sizehint, MIN_READ_SIZE):
+            self._buffer.extend(bytes(max(len(self._buffer), sizehint)))
+        return memoryview(self._buffer)[self._end:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._end += nbytes
+        while not self._closed:
+            header_end = self._buffer.find(HEADER_END, self._start, self._end)
+            if header_end < 0:
+                return
+            body_start = header_end + len(HEADER_END)
+            length = _content_length(bytes(self._buffer[self._start:header_end]))
+            if length <= 0:
+                # The body can't be delimited, so the stream can't be resynchronized
+                logger.error("LSP message without Content-Length, ending session")
+                self._close()
+                return
+            if self._end - body_start < length:
+                return  # Body not complete yet
+
+            self._start = body_start + length
+            try:
+                with memoryview(self._buffer) as view:
+                    message = _decode_message(view[body_start:self._start])
+            except Exception:
+                logger.exception("Error decoding message")
+                continue
+            self._queue.put_nowait(message)
+
+    def data_received(self, data: bytes) -> None:
+        # Pipe transports without buffered-read support hand over bytes instead
+        buffer = self.get_buffer(len(data))
+        buffer[:len(data)] = data
+        del buffer
+        self.buffer_updated(len(data))
+
+    def _close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._queue.put_nowait(None)
+
+    def eof_received(self) -> None:
+        self._close()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._close()
+
 
 class HyperLanguageServer:
     """
@@ -47,8 +207,22 @@ class HyperLanguageServer:
         self.documents: dict[str, str] = {}  # URI -> content
         self.source_maps: dict[str, SourceMap] = {}  # URI -> source map
         self.virtual_documents: dict[str, str] = {}  # hyper URI -> generated Python
-        self.pyright_process: Optional[subprocess.Popen] = None
+        self.pyright_process: asyncio.subprocess.Process | None = None
         self.request_id = 0
+        # Pyright request id -> future resolved by the Pyright reader task
+        self._pyright_requests: dict[int, asyncio.Future] = {}
+        self._pyright_reader: asyncio.Task | None = None
+        # Proxied requests still waiting on Pyright, answered concurrently
+        self._proxy_tasks: set[asyncio.Task] = set()
+        # Python URI -> latest unsent didChange, coalesced while the user types
+        self._pending_changes: dict[str, dict] = {}
+        self._flush_task: asyncio.Task | None = None
+        # (URI, content digest) -> transform result, least recently used first
+        self._transform_cache: OrderedDict[tuple[str, bytes], TransformResult] = OrderedDict()
+        # URI -> latest transform result, so edits only re-transform changed lines
+        self._last_transform: dict[str, TransformResult] = {}
+        # LSP method -> (handler, kind)
+        self._handlers = self._build_handlers()
 
     async def start(self):
         """Start the LSP server."""
@@ -58,136 +232,208 @@ class HyperLanguageServer:
         await self._start_pyright()
 
         # Read from stdin, write to stdout (standard LSP transport)
-        await self._run_server()
+        try:
+            await self._run_server()
+        finally:
+            await self._stop_pyright()
+
+    async def _stop_pyright(self):
+        """Shut down Pyright while the event loop can still close its pipes."""
+        self._drop_pending_changes()
+        if not self.pyright_process:
+            return
+        if self.pyright_process.returncode is None:
+            self.pyright_process.terminate()
+        await self.pyright_process.wait()
+        if self._pyright_reader is not None:
+            await self._pyright_reader
 
     async def _start_pyright(self):
         """Start Pyright language server as a subprocess."""
         try:
-            self.pyright_process = subprocess.Popen(
-                ['pyright-langserver', '--stdio'],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            # Async pipes: writes wait on flow control instead of blocking the loop.
+            # stderr is discarded since nothing reads it and a full pipe would stall Pyright.
+            self.pyright_process = await asyncio.create_subprocess_exec(
+                'pyright-langserver', '--stdio',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=2 ** 20,
             )
             logger.info("Pyright started successfully")
         except FileNotFoundError:
             logger.warning("Pyright not found. Install with: pip install pyright")
             self.pyright_process = None
+            return
+
+        self._pyright_reader = asyncio.create_task(self._read_pyright_loop())
+        await self._initialize_pyright()
+
+    async def _initialize_pyright(self):
+        """Run the LSP initialize handshake with Pyright."""
+        response = await self._send_request_to_pyright('initialize', {
+            'processId': os.getpid(),
+            'rootUri': Path.cwd().as_uri(),
+            'capabilities': {},
+        })
+        if response is None:
+            logger.warning("Pyright did not answer initialize")
+            return
+        await self._send_to_pyright({'jsonrpc': '2.0', 'method': 'initialized', 'params': {}})
+
+    async def _read_pyright_loop(self):
+        """Read Pyright's output and resolve the matching pending requests."""
+        reader = self.pyright_process.stdout
+        try:
+            while True:
+                message = await self._read_message(reader)
+                if message is None:
+                    break
+                # Responses carry an id and no method; anything else is Pyright talking to us
+                if 'method' not in message:
+                    future = self._pyright_requests.pop(message.get('id'), None)
+                    if future is not None and not future.done():
+                        future.set_result(message)
+                elif 'id' in message:
+                    # Pyright waits for an answer to its requests
+                    await self._send_to_pyright(self._answer_pyright_request(message))
+                else:
+                    logger.debug("Ignoring Pyright notification: %s", message['method'])
+        except Exception:
+            logger.exception("Error reading from Pyright")
+        finally:
+            # Pyright is gone: unblock everyone still waiting on it
+            for future in self._pyright_requests.values():
+                if not future.done():
+                    future.set_result(None)
+            self._pyright_requests.clear()
+
+    def _answer_pyright_request(self, message: dict) -> dict:
+        """Reply to a request from Pyright: no settings, and nothing else to offer."""
+        result = None
+        if message['method'] == 'workspace/configuration':
+            result = [None] * len(message.get('params', {}).get('items', []))
+        return {'jsonrpc': '2.0', 'id': message['id'], 'result': result}
 
     async def _run_server(self):
         """Main server loop - read LSP messages from stdin."""
-        reader = asyncio.StreamReader()
-        protocol = asyncio.StreamReaderProtocol(reader)
-        await asyncio.get_event_loop().connect_read_pipe(lambda: protocol, sys.stdin)
+        messages: asyncio.Queue = asyncio.Queue()
+        await asyncio.get_event_loop().connect_read_pipe(
+            lambda: LspReaderProtocol(messages), sys.stdin
+        )
 
         writer_transport, writer_protocol = await asyncio.get_event_loop().connect_write_pipe(
             asyncio.streams.FlowControlMixin, sys.stdout
         )
-        writer = asyncio.StreamWriter(writer_transport, writer_protocol, reader, asyncio.get_event_loop())
+        writer = asyncio.StreamWriter(writer_transport, writer_protocol, None, asyncio.get_event_loop())
 
         while True:
-            try:
-                message = await self._read_message(reader)
-                if message is None:
-                    break
-
-                response = await self._handle_message(message)
-                if response is not None:
-                    await self._write_message(writer, response)
+            message = await messages.get()
+            if message is None:
+                break
 
-            except Exception as e:
-                logger.exception(f"Error handling message: {e}")
+            entry = self._handlers.get(message.get('method', ''))
+            if entry is not None and entry[1] == 'proxy':
+                # Answered by Pyright: don't hold up the messages behind it
+                task = asyncio.create_task(self._respond(writer, message))
+                self._proxy_tasks.add(task)
+                task.add_done_callback(self._proxy_tasks.discard)
+            else:
+                await self._respond(writer, message)
+
+    async def _respond(self, writer: asyncio.StreamWriter, message: dict):
+        """Handle one message and write its response, if any."""
+        try:
+            response = await self._handle_message(message)
+            if response is not None:
+                await self._write_message(writer, response)
+        except Exception:
+            logger.exception("Error handling message")
 
-    async def _read_message(self, reader: asyncio.StreamReader) -> Optional[dict]:
+    async def _read_message(self, reader: asyncio.StreamReader) -> dict | None:
         """Read a JSON-RPC message from the LSP stream."""
-        # Read headers
-        headers = {}
-        while True:
-            line = await reader.readline()
-            if not line:
-                return None
-            line = line.decode('utf-8').strip()
-            if not line:
-                break
-            if ':' in line:
-                key, value = line.split(':', 1)
-                headers[key.strip().lower()] = value.strip()
+        # Read the whole header block in one call
+        try:
+            headers = await reader.readuntil(HEADER_END)
+        except asyncio.IncompleteReadError:
+            return None
 
         # Read content
-        content_length = int(headers.get('content-length', 0))
+        content_length = _content_length(headers[:-len(HEADER_END)])
         if content_length == 0:
             return None
 
         content = await reader.readexactly(content_length)
-        return json.loads(content.decode('utf-8'))
+        return _decode_message(content)
 
     async def _write_message(self, writer: asyncio.StreamWriter, message: dict):
         """Write a JSON-RPC message to the LSP stream."""
-        content = json.dumps(message)
-        header = f"Content-Length: {len(content)}\r\n\r\n"
-        writer.write(header.encode('utf-8'))
-        writer.write(content.encode('utf-8'))
+        writer.writelines(_encode_message(message))
         await writer.drain()
 
-    async def _handle_message(self, message: dict) -> Optional[dict]:
+    async def _handle_message(self, message: dict) -> dict | None:
         """Handle an incoming LSP message."""
         method = message.get('method', '')
         msg_id = message.get('id')
         params = message.get('params', {})
 
-        logger.debug(f"Received: {method}")
-
-        # Handle initialization
-        if method == 'initialize':
-            return self._handle_initialize(msg_id, params)
-
-        elif method == 'initialized':
-            return None  # Notification, no response
+        logger.debug("Received: %s", method)
 
-        elif method == 'shutdown':
-            return {'jsonrpc': '2.0', 'id': msg_id, 'result': None}
-
-        elif method == 'exit':
-            sys.exit(0)
-
-        # Document synchronization
-        elif method == 'textDocument/didOpen':
-            await self._handle_did_open(params)
-            return None
-
-        elif method == 'textDocument/didChange':
-            await self._handle_did_change(params)
+        entry = self._handlers.get(method)
+        if entry is None:
+            logger.debug("Unhandled method: %s", method)
+            if msg_id is not None:
+                return {
+                    'jsonrpc': '2.0',
+                    'id': msg_id,
+                    'error': {'code': -32601, 'message': f'Method not found: {method}'}
+                }
             return None
 
-        elif method == 'textDocument/didClose':
-            await self._handle_did_close(params)
+        handler, kind = entry
+        if kind == 'request':
+            return handler(msg_id, params)
+        if kind == 'notification':
+            await handler(params)
             return None
-
         # Language features - proxy to Pyright
-        elif method == 'textDocument/completion':
-            return await self._proxy_to_pyright(msg_id, method, params)
+        return await handler(msg_id, method, params)
 
-        elif method == 'textDocument/hover':
-            return await self._proxy_to_pyright(msg_id, method, params)
+    def _build_handlers(self) -> dict[str, tuple[Callable, str]]:
+        """
+        Map each LSP method to (handler, kind), looked up once per message.
 
-        elif method == 'textDocument/definition':
-            return await self._proxy_to_pyright(msg_id, method, params)
+        Kinds: 'request' handlers are sync and return the response,
+        'notification' handlers are async and return nothing, and 'proxy'
+        methods are forwarded to Pyright.
+        """
+        handlers: dict[str, tuple[Callable, str]] = {
+            # Lifecycle
+            'initialize': (self._handle_initialize, 'request'),
+            'initialized': (self._handle_initialized, 'request'),
+            'shutdown': (self._handle_shutdown, 'request'),
+            'exit': (self._handle_exit, 'request'),
+            # Document synchronization
+            'textDocument/didOpen': (self._handle_did_open, 'notification'),
+            'textDocument/didChange': (self._handle_did_change, 'notification'),
+            'textDocument/didClose': (self._handle_did_close, 'notification'),
+        }
+        for method in PROXIED_METHODS:
+            handlers[method] = (self._proxy_to_pyright, 'proxy')
+        return handlers
 
-        elif method == 'textDocument/references':
-            return await self._proxy_to_pyright(msg_id, method, params)
+    def _handle_initialized(self, msg_id: Any, params: dict) -> None:
+        """Handle initialized notification."""
+        return None  # Notification, no response
 
-        elif method == 'textDocument/documentSymbol':
-            return await self._proxy_to_pyright(msg_id, method, params)
+    def _handle_shutdown(self, msg_id: Any, params: dict) -> dict:
+        """Handle shutdown request."""
+        self._drop_pending_changes()
+        return {'jsonrpc': '2.0', 'id': msg_id, 'result': None}
 
-        else:
-            logger.debug(f"Unhandled method: {method}")
-            if msg_id is not None:
-                return {
-                    'jsonrpc': '2.0',
-                    'id': msg_id,
-                    'error': {'code': -32601, 'message': f'Method not found: {method}'}
-                }
-            return None
+    def _handle_exit(self, msg_id: Any, params: dict) -> None:
+        """Handle exit notification."""
+        sys.exit(0)
 
     def _handle_initialize(self, msg_id: int, params: dict) -> dict:
         """Handle initialize request."""
@@ -215,6 +461,24 @@ class HyperLanguageServer:
             }
         }
 
+    def _transform(self, uri: str, content: str) -> TransformResult:
+        """Transform a document, reusing the result for content seen before.
+
+        Editors resend identical text (undo/redo, no-op changes), so results are
+        kept in a small LRU keyed by URI and a digest of the content.
+        """
+        key = (uri, hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest())
+        result = self._transform_cache.get(key)
+        if result is not None:
+            self._transform_cache.move_to_end(key)
+        else:
+            result = transform(content, uri, prev=self._last_transform.get(uri))
+            self._transform_cache[key] = result
+            if len(self._transform_cache) > TRANSFORM_CACHE_SIZE:
+                self._transform_cache.popitem(last=False)
+        self._last_transform[uri] = result
+        return result
+
     async def _handle_did_open(self, params: dict):
         """Handle textDocument/didOpen - transform and cache the document."""
         uri = params['textDocument']['uri']
@@ -223,14 +487,16 @@ class HyperLanguageServer:
         self.documents[uri] = content
 
         # Transform to Python
-        result = transform(content, uri)
+        result = self._transform(uri, content)
         self.virtual_documents[uri] = result.python_code
         self.source_maps[uri] = result.source_map
 
-        logger.debug(f"Opened {uri}, generated Python:\n{result.python_code[:500]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Opened %s, generated Python:\n%s...", uri, result.python_code[:500])
 
-        # Forward to Pyright with virtual document
+        # Forward to Pyright with virtual document (superseding any queued change)
         if self.pyright_process:
+            self._pending_changes.pop(result.source_map.python_uri, None)
             await self._send_to_pyright({
                 'jsonrpc': '2.0',
                 'method': 'textDocument/didOpen',
@@ -254,13 +520,13 @@ class HyperLanguageServer:
 
         # Re-transform
         if uri in self.documents:
-            result = transform(self.documents[uri], uri)
+            result = self._transform(uri, self.documents[uri])
             self.virtual_documents[uri] = result.python_code
             self.source_maps[uri] = result.source_map
 
-            # Forward to Pyright
+            # Forward to Pyright (full sync, so only the latest change matters)
             if self.pyright_process:
-                await self._send_to_pyright({
+                self._pending_changes[result.source_map.python_uri] = {
                     'jsonrpc': '2.0',
                     'method': 'textDocument/didChange',
                     'params': {
@@ -270,14 +536,47 @@ class HyperLanguageServer:
                         },
                         'contentChanges': [{'text': result.python_code}]
                     }
-                })
+                }
+                if self._flush_task is None:
+                    self._flush_task = asyncio.create_task(self._flush_changes_later())
+
+    async def _flush_changes_later(self):
+        """Forward coalesced didChange notifications after a short quiet period."""
+        await asyncio.sleep(CHANGE_FLUSH_DELAY)
+        self._flush_task = None
+        await self._flush_changes()
+
+    async def _flush_changes(self):
+        """Send every pending didChange to Pyright, one per document."""
+        pending, self._pending_changes = self._pending_changes, {}
+        if not pending or not self.pyright_process:
+            return
+
+        # Write every frame before the first await, so a flush that runs while
+        # this one drains can't slip a newer version ahead of an older one
+        stdin = self.pyright_process.stdin
+        for message in pending.values():
+            stdin.writelines(_encode_message(message))
+        await stdin.drain()
+
+    def _drop_pending_changes(self):
+        """Discard coalesced didChange notifications that haven't been sent yet."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._pending_changes.clear()
 
     async def _handle_did_close(self, params: dict):
         """Handle textDocument/didClose."""
         uri = params['textDocument']['uri']
+        # A closed document's queued change must not reach Pyright afterwards
+        source_map = self.source_maps.get(uri)
+        if source_map is not None:
+            self._pending_changes.pop(source_map.python_uri, None)
         self.documents.pop(uri, None)
         self.virtual_documents.pop(uri, None)
         self.source_maps.pop(uri, None)
+        self._last_transform.pop(uri, None)
 
     async def _proxy_to_pyright(self, msg_id: int, method: str, params: dict) -> dict:
         """
@@ -301,7 +600,8 @@ class HyperLanguageServer:
         # Transform request positions
         transformed_params = self._transform_request_positions(params, source_map)
 
-        # Send to Pyright
+        # Send to Pyright, after any edits it hasn't seen yet
+        await self._flush_changes()
         response = await self._send_request_to_pyright(method, transformed_params)
 
         # Transform response positions back
@@ -339,34 +639,32 @@ class HyperLanguageServer:
         return params
 
     def _transform_response_positions(self, result: Any, source_map: SourceMap) -> Any:
-        """Transform positions in response from .py to .hyper coordinates."""
-        if result is None:
-            return None
+        """Transform positions in response from .py to .hyper coordinates.
 
-        if isinstance(result, list):
-            return [self._transform_response_positions(item, source_map) for item in result]
+        Pyright responses are freshly decoded, so they are rewritten in place
+        with an explicit stack instead of being copied node by node.
+        """
+        python_uri = source_map.python_uri
+        stack = [result] if type(result) in CONTAINER_TYPES else []
+        while stack:
+            node = stack.pop()
 
-        if isinstance(result, dict):
-            result = dict(result)
+            if type(node) is list:
+                stack.extend(item for item in node if type(item) in CONTAINER_TYPES)
+                continue
 
             # Transform URI
-            if 'uri' in result and result['uri'] == source_map.python_uri:
-                result['uri'] = source_map.hyper_uri
-
-            # Transform range
-            if 'range' in result:
-                result['range'] = self._transform_range(result['range'], source_map)
-
-            # Transform location
-            if 'location' in result:
-                result['location'] = self._transform_response_positions(result['location'], source_map)
+            if node.get('uri') == python_uri:
+                node['uri'] = source_map.hyper_uri
 
-            # Recurse into nested structures
-            for key, value in list(result.items()):
-                if isinstance(value, (dict, list)):
-                    result[key] = self._transform_response_positions(value, source_map)
+            # Transform range (its start/end need no further walking)
+            if 'range' in node:
+                node['range'] = self._transform_range(node['range'], source_map)
 
-            return result
+            # Walk nested structures (e.g. 'location', 'children')
+            for key, value in node.items():
+                if key != 'range' and type(value) in CONTAINER_TYPES:
+                    stack.append(value)
 
         return result
 
@@ -397,13 +695,10 @@ class HyperLanguageServer:
         if not self.pyright_process:
             return
 
-        content = json.dumps(message)
-        header = f"Content-Length: {len(content)}\r\n\r\n"
-        self.pyright_process.stdin.write(header.encode('utf-8'))
-        self.pyright_process.stdin.write(content.encode('utf-8'))
-        self.pyright_process.stdin.flush()
+        self.pyright_process.stdin.writelines(_encode_message(message))
+        await self.pyright_process.stdin.drain()
 
-    async def _send_request_to_pyright(self, method: str, params: dict) -> Optional[dict]:
+    async def _send_request_to_pyright(self, method: str, params: dict) -> dict | None:
         """Send a request to Pyright and wait for response."""
         if not self.pyright_process:
             return None
@@ -416,15 +711,18 @@ class HyperLanguageServer:
             'params': params
         }
 
-        content = json.dumps(request)
-        header = f"Content-Length: {len(content)}\r\n\r\n"
-        self.pyright_process.stdin.write(header.encode('utf-8'))
-        self.pyright_process.stdin.write(content.encode('utf-8'))
-        self.pyright_process.stdin.flush()
-
-        # Read response (simplified - real impl would be more robust)
-        # For now, return None - this needs proper async handling
-        return None
+        # The reader task resolves this future when the response arrives
+        future = asyncio.get_running_loop().create_future()
+        self._pyright_requests[self.request_id] = future
+        try:
+            self.pyright_process.stdin.writelines(_encode_message(request))
+            await self.pyright_process.stdin.drain()
+            return await asyncio.wait_for(future, PYRIGHT_REQUEST_TIMEOUT)
+        except TimeoutError:
+            logger.warning("Pyright did not answer %s in time", method)
+            return None
+        finally:
+            self._pyright_requests.pop(request['id'], None)
 
 
 async def main():
@@ -433,5 +731,13 @@ async def main():
     await server.start()
 
 
+def run():
+    """Run the server, on uvloop's event loop when it's installed."""
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
+
+
 if __name__ == '__main__':
-    asyncio.run(main())
+    run()
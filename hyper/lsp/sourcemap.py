@@ -4,6 +4,7 @@ Source map for tracking positions between .hyper and generated Python files.
 Like how templ maps .templ -> .go positions, we map .hyper -> .py positions.
 """
 
+from array import array
 from dataclasses import dataclass
 from typing import Optional
 
@@ -42,14 +43,31 @@ class SourceMap:
         self.hyper_uri = hyper_uri
         self.python_uri = python_uri
         self.mappings: list[Mapping] = []
-        # Line-level mappings for simple cases
-        self._hyper_to_python_lines: dict[int, int] = {}
-        self._python_to_hyper_lines: dict[int, int] = {}
+        # Line-level mappings for simple cases, indexed by line (-1 = unmapped)
+        self._h2p = array('i')
+        self._p2h = array('i')
 
     def add_line_mapping(self, hyper_line: int, python_line: int) -> None:
         """Add a simple line-to-line mapping."""
-        self._hyper_to_python_lines[hyper_line] = python_line
-        self._python_to_hyper_lines[python_line] = hyper_line
+        _set_line(self._h2p, hyper_line, python_line)
+        _set_line(self._p2h, python_line, hyper_line)
+
+    def set_line_mappings(self, python_lines: array) -> None:
+        """Replace all line mappings at once: .hyper line i maps to python_lines[i]."""
+        self._h2p = array('i', python_lines)
+        self._p2h = array('i', [-1]) * (max(python_lines) + 1 if python_lines else 0)
+        for hyper_line, python_line in enumerate(python_lines):
+            self._p2h[python_line] = hyper_line
+
+    @property
+    def _hyper_to_python_lines(self) -> dict[int, int]:
+        """Line mappings from .hyper to .py as a dict."""
+        return {h: p for h, p in enumerate(self._h2p) if p >= 0}
+
+    @property
+    def _python_to_hyper_lines(self) -> dict[int, int]:
+        """Line mappings from .py to .hyper as a dict."""
+        return {p: h for p, h in enumerate(self._p2h) if h >= 0}
 
     def add_mapping(self, source: Range, target: Range) -> None:
         """Add a range mapping."""
@@ -77,11 +95,8 @@ class SourceMap:
                 return Position(line=target_line, character=target_char)
 
         # Fall back to line mapping
-        if pos.line in self._hyper_to_python_lines:
-            return Position(
-                line=self._hyper_to_python_lines[pos.line],
-                character=pos.character
-            )
+        if 0 <= pos.line < len(self._h2p) and (line := self._h2p[pos.line]) >= 0:
+            return Position(line=line, character=pos.character)
 
         return None
 
@@ -105,11 +120,8 @@ class SourceMap:
                 return Position(line=source_line, character=source_char)
 
         # Fall back to line mapping
-        if pos.line in self._python_to_hyper_lines:
-            return Position(
-                line=self._python_to_hyper_lines[pos.line],
-                character=pos.character
-            )
+        if 0 <= pos.line < len(self._p2h) and (line := self._p2h[pos.line]) >= 0:
+            return Position(line=line, character=pos.character)
 
         return None
 
@@ -122,3 +134,10 @@ class SourceMap:
         if pos.line == range.end.line and pos.character > range.end.character:
             return False
         return True
+
+
+def _set_line(lines: array, index: int, value: int) -> None:
+    """Set lines[index], padding any gap with -1 (unmapped)."""
+    if index >= len(lines):
+        lines.extend(array('i', [-1]) * (index + 1 - len(lines)))
+    lines[index] = value
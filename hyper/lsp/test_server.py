@@ -0,0 +1,275 @@
+"""Test the LSP server's message framing and Pyright proxying."""
+
+import asyncio
+import json
+
+from . import server
+from .server import (
+    HEADER_END,
+    MIN_READ_SIZE,
+    HyperLanguageServer,
+    LspReaderProtocol,
+    _encode_message,
+)
+
+
+def _frame(message: dict) -> bytes:
+    header, body = _encode_message(message)
+    return header + body
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait())
+    return messages
+
+
+def test_coalesced_frames():
+    """Several messages arriving in one read are all parsed, in order."""
+    queue = asyncio.Queue()
+    protocol = LspReaderProtocol(queue)
+
+    protocol.data_received(
+        _frame({'id': 1, 'method': 'a'}) + _frame({'id': 2, 'method': 'b'})
+    )
+
+    assert _drain(queue) == [{'id': 1, 'method': 'a'}, {'id': 2, 'method': 'b'}]
+
+
+def test_split_frame():
+    """A message split across reads, headers included, is parsed once complete."""
+    queue = asyncio.Queue()
+    protocol = LspReaderProtocol(queue)
+    data = _frame({'id': 1, 'method': 'textDocument/hover'})
+
+    for i in range(len(data) - 1):
+        protocol.data_received(data[i:i + 1])
+        assert queue.empty()
+    protocol.data_received(data[-1:])
+
+    assert _drain(queue) == [{'id': 1, 'method': 'textDocument/hover'}]
+
+
+def test_partial_body_then_next_frame():
+    """A large body arriving in pieces, followed by the start of the next frame."""
+    queue = asyncio.Queue()
+    protocol = LspReaderProtocol(queue)
+    big = {'id': 1, 'text': 'x' * (MIN_READ_SIZE * 3)}
+    data = _frame(big) + _frame({'id': 2})
+    cut = len(data) - 5
+
+    for start in range(0, cut, 10_000):
+        protocol.data_received(data[start:min(start + 10_000, cut)])
+    assert _drain(queue) == [big]
+
+    protocol.data_received(data[cut:])
+    assert _drain(queue) == [{'id': 2}]
+
+
+def test_missing_content_length_ends_session():
+    """A frame without Content-Length ends the session, like EOF."""
+    queue = asyncio.Queue()
+    protocol = LspReaderProtocol(queue)
+
+    protocol.data_received(b'Content-Type: x\r\n\r\n{}' + _frame({'id': 1}))
+    protocol.data_received(_frame({'id': 2}))
+
+    assert _drain(queue) == [None]
+
+
+def test_zero_content_length_ends_session():
+    queue = asyncio.Queue()
+    protocol = LspReaderProtocol(queue)
+
+    protocol.data_received(b'Content-Length: 0\r\n\r\n')
+
+    assert _drain(queue) == [None]
+
+
+def test_eof_queues_none_once():
+    queue = asyncio.Queue()
+    protocol = LspReaderProtocol(queue)
+
+    protocol.eof_received()
+    protocol.connection_lost(None)
+
+    assert _drain(queue) == [None]
+
+
+class _FakePyrightStdin:
+    """Collects the messages written to Pyright."""
+
+    def __init__(self):
+        self.messages = []
+
+    def writelines(self, parts):
+        self.messages.append(json.loads(b''.join(parts).split(HEADER_END, 1)[1]))
+
+    async def drain(self):
+        pass
+
+
+class _FakePyright:
+    def __init__(self, output: bytes = b''):
+        self.stdin = _FakePyrightStdin()
+        self.stdout = asyncio.StreamReader()
+        self.stdout.feed_data(output)
+        self.stdout.feed_eof()
+
+
+def test_pyright_request_times_out(monkeypatch):
+    """A request Pyright never answers returns None instead of hanging."""
+    monkeypatch.setattr(server, 'PYRIGHT_REQUEST_TIMEOUT', 0.01)
+
+    async def run():
+        lsp = HyperLanguageServer()
+        lsp.pyright_process = _FakePyright()
+        response = await lsp._send_request_to_pyright('textDocument/hover', {})
+        return lsp, response
+
+    lsp, response = asyncio.run(run())
+
+    assert response is None
+    assert lsp._pyright_requests == {}
+    assert lsp.pyright_process.stdin.messages[0]['method'] == 'textDocument/hover'
+
+
+def test_pyright_requests_are_answered():
+    """Requests from Pyright get a reply; responses resolve pending requests."""
+    output = (
+        _frame({'jsonrpc': '2.0', 'id': 7, 'method': 'workspace/configuration',
+                'params': {'items': [{'section': 'python'}, {'section': 'pyright'}]}})
+        + _frame({'jsonrpc': '2.0', 'id': 8, 'method': 'client/registerCapability',
+                  'params': {}})
+        + _frame({'jsonrpc': '2.0', 'id': 1, 'result': {'contents': 'int'}})
+    )
+
+    async def run():
+        lsp = HyperLanguageServer()
+        lsp.pyright_process = _FakePyright(output)
+        future = asyncio.get_running_loop().create_future()
+        lsp._pyright_requests[1] = future
+        await lsp._read_pyright_loop()
+        return lsp, future.result()
+
+    lsp, result = asyncio.run(run())
+
+    assert result == {'jsonrpc': '2.0', 'id': 1, 'result': {'contents': 'int'}}
+    assert lsp.pyright_process.stdin.messages == [
+        {'jsonrpc': '2.0', 'id': 7, 'result': [None, None]},
+        {'jsonrpc': '2.0', 'id': 8, 'result': None},
+    ]
+
+
+def test_pyright_initialize_handshake():
+    """Pyright is sent initialize, then initialized once it answers."""
+    output = _frame({'jsonrpc': '2.0', 'id': 1, 'result': {'capabilities': {}}})
+
+    async def run():
+        lsp = HyperLanguageServer()
+        lsp.pyright_process = _FakePyright(output)
+        reader = asyncio.create_task(lsp._read_pyright_loop())
+        await lsp._initialize_pyright()
+        await reader
+        return lsp
+
+    lsp = asyncio.run(run())
+
+    sent = lsp.pyright_process.stdin.messages
+    assert [m['method'] for m in sent] == ['initialize', 'initialized']
+    assert sent[0]['id'] == 1
+
+
+def _did_change(uri: str, text: str) -> dict:
+    return {
+        'textDocument': {'uri': uri, 'version': 2},
+        'contentChanges': [{'text': text}],
+    }
+
+
+def test_queued_change_not_sent_after_close():
+    """A didChange held back for coalescing is dropped when the document closes."""
+    uri = 'file:///page.hyper'
+
+    async def run():
+        lsp = HyperLanguageServer()
+        lsp.pyright_process = _FakePyright()
+        await lsp._handle_did_open({'textDocument': {'uri': uri, 'text': '<p>a</p>\n'}})
+        await lsp._handle_did_change(_did_change(uri, '<p>b</p>\n'))
+        await lsp._handle_did_close({'textDocument': {'uri': uri}})
+        await asyncio.sleep(server.CHANGE_FLUSH_DELAY * 3)
+        return lsp
+
+    lsp = asyncio.run(run())
+
+    assert [m['method'] for m in lsp.pyright_process.stdin.messages] == [
+        'textDocument/didOpen'
+    ]
+
+
+def test_queued_change_not_sent_after_shutdown():
+    """Shutdown cancels the pending flush instead of letting it fire later."""
+    uri = 'file:///page.hyper'
+
+    async def run():
+        lsp = HyperLanguageServer()
+        lsp.pyright_process = _FakePyright()
+        await lsp._handle_did_open({'textDocument': {'uri': uri, 'text': '<p>a</p>\n'}})
+        await lsp._handle_did_change(_did_change(uri, '<p>b</p>\n'))
+        lsp._handle_shutdown(1, {})
+        await asyncio.sleep(server.CHANGE_FLUSH_DELAY * 3)
+        return lsp
+
+    lsp = asyncio.run(run())
+
+    assert lsp._flush_task is None
+    assert [m['method'] for m in lsp.pyright_process.stdin.messages] == [
+        'textDocument/didOpen'
+    ]
+
+
+class _BlockingPyrightStdin(_FakePyrightStdin):
+    """Holds every drain until released, like a full pipe."""
+
+    def __init__(self):
+        super().__init__()
+        self.released = asyncio.Event()
+
+    async def drain(self):
+        await self.released.wait()
+
+
+def test_overlapping_flushes_keep_change_order():
+    """A flush running while another drains can't be overtaken by stale changes."""
+    one, two = 'file:///one.hyper', 'file:///two.hyper'
+
+    async def run():
+        lsp = HyperLanguageServer()
+        lsp.pyright_process = _FakePyright()
+        for uri in (one, two):
+            await lsp._handle_did_open({'textDocument': {'uri': uri, 'text': '<p>a</p>\n'}})
+        lsp.pyright_process.stdin = stdin = _BlockingPyrightStdin()
+
+        await lsp._handle_did_change(_did_change(one, '<p>b</p>\n'))
+        await lsp._handle_did_change(_did_change(two, '<p>b</p>\n'))
+        first = asyncio.create_task(lsp._flush_changes())
+        await asyncio.sleep(0)
+        await lsp._handle_did_change(_did_change(two, '<p>c</p>\n'))
+        second = asyncio.create_task(lsp._flush_changes())
+        await asyncio.sleep(0)
+        stdin.released.set()
+        await asyncio.gather(first, second)
+        lsp._drop_pending_changes()
+        return stdin.messages
+
+    sent = [
+        (m['params']['textDocument']['uri'], m['params']['contentChanges'][0]['text'])
+        for m in asyncio.run(run())
+    ]
+
+    assert [(uri, text.rsplit('# ', 1)[1]) for uri, text in sent] == [
+        ('file:///one_hyper.py', '<p>b</p>'),
+        ('file:///two_hyper.py', '<p>b</p>'),
+        ('file:///two_hyper.py', '<p>c</p>'),
+    ]
@@ -29,8 +29,9 @@ Example:
 """
 
 import re
+from array import array
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 
 from .sourcemap import SourceMap, Position, Range
 
@@ -40,6 +41,8 @@ class TransformResult:
     """Result of transforming a .hyper file."""
     python_code: str
     source_map: SourceMap
+    # (in_props, line) -> (leaves_props, python_line), reused by incremental transforms
+    line_cache: dict[tuple[bool, str], tuple[bool, str]] = field(default_factory=dict, repr=False)
 
 
 @dataclass
@@ -49,29 +52,65 @@ class TransformContext:
     source_map: SourceMap = field(default_factory=lambda: SourceMap("", ""))
     current_hyper_line: int = 0
     current_python_line: int = 0
+    # Python line for each .hyper line, in order; stored in the source map at the end
+    python_lines: array = field(default_factory=lambda: array('i'))
     indent_stack: list[int] = field(default_factory=list)  # Track indentation levels
 
 
 # Regex patterns
 PROP_PATTERN = re.compile(r'^([a-z_][a-z_0-9]*)\s*:\s*(.+?)(?:\s*=\s*(.+))?$')
-IF_PATTERN = re.compile(r'^(\s*)(if)\s+(.+):$')
-ELIF_PATTERN = re.compile(r'^(\s*)(elif)\s+(.+):$')
-ELSE_PATTERN = re.compile(r'^(\s*)(else):$')
-FOR_PATTERN = re.compile(r'^(\s*)(for)\s+(\w+)\s+(in)\s+(.+):$')
-MATCH_PATTERN = re.compile(r'^(\s*)(match)\s+(.+):$')
-CASE_PATTERN = re.compile(r'^(\s*)(case)\s+(.+):$')
-END_PATTERN = re.compile(r'^(\s*)(end)\s*$')
-HTML_TAG_PATTERN = re.compile(r'^(\s*)<([a-zA-Z][a-zA-Z0-9-]*)')
 EXPRESSION_PATTERN = re.compile(r'\{([^}]+)\}')
 
-
-def transform(hyper_content: str, hyper_uri: str) -> TransformResult:
+# All line kinds in one alternation, tried in this order. Each kind is an outer
+# named group, so match.lastgroup names the kind that matched. Matched from the
+# end of the line's indentation (LINE_PATTERN.match(line, indent_len)).
+LINE_PATTERN = re.compile(
+    r'(?:'
+    r'(?P<if>if\s+(?P<if_cond>.+):$)'
+    r'|(?P<elif>elif\s+(?P<elif_cond>.+):$)'
+    r'|(?P<else>else:$)'
+    r'|(?P<for>for\s+(?P<for_var>\w+)\s+in\s+(?P<for_iter>.+):$)'
+    r'|(?P<match>match\s+(?P<match_subject>.+):$)'
+    r'|(?P<case>case\s+(?P<case_pattern>.+):$)'
+    r'|(?P<end>end\s*$)'
+    r'|(?P<html><[a-zA-Z])'
+    r')'
+)
+
+# Shared indent strings for the usual nesting depths
+INDENTS = tuple(' ' * width for width in range(64))
+
+
+def _indent(width: int) -> str:
+    """Return an indent string of the given width, shared for common widths."""
+    return INDENTS[width] if width < len(INDENTS) else ' ' * width
+
+
+# Control flow line kind -> Python line builder
+CONTROL_FLOW: dict[str, Callable[[str, re.Match], str]] = {
+    'if': lambda indent, m: f"{indent}if {m['if_cond']}:",
+    'elif': lambda indent, m: f"{indent}elif {m['elif_cond']}:",
+    'else': lambda indent, m: f"{indent}else:",
+    'for': lambda indent, m: f"{indent}for {m['for_var']} in {m['for_iter']}:",
+    'match': lambda indent, m: f"{indent}match {m['match_subject']}:",
+    'case': lambda indent, m: f"{indent}case {m['case_pattern']}:",
+    # 'end' becomes 'pass' if the previous line was a control statement
+    # or we just skip it and Python's indentation handles the rest
+    'end': lambda indent, m: f"{indent}pass  # end",
+}
+
+
+def transform(
+    hyper_content: str, hyper_uri: str, prev: Optional[TransformResult] = None
+) -> TransformResult:
     """
     Transform .hyper content into valid Python.
 
     Args:
         hyper_content: The content of the .hyper file
         hyper_uri: The URI of the .hyper file (for source map)
+        prev: Previous result for the same document; lines it already
+              transformed are reused instead of re-matched
 
     Returns:
         TransformResult with Python code and source map
@@ -89,119 +128,85 @@ def transform(hyper_content: str, hyper_uri: str) -> TransformResult:
 
     in_props = True  # Start assuming we're in props section
 
+    # Each line's output depends only on its text and whether we're still in
+    # the props section, so unchanged lines reuse the previous result's output
+    # and only edited lines go through the regexes.
+    previous = prev.line_cache if prev is not None else {}
+    line_cache: dict[tuple[bool, str], tuple[bool, str]] = {}
+
     for hyper_line_num, line in enumerate(lines):
         ctx.current_hyper_line = hyper_line_num
 
-        # Empty line
-        if not line.strip():
-            _emit_with_mapping(ctx, "")
-            continue
-
-        # Check if we've left props section (first HTML or control flow)
-        if in_props:
-            if line.strip().startswith('<') or _is_control_flow(line):
-                in_props = False
-                _emit(ctx, "")  # Add separator after props
-
-        # Props
-        if in_props:
-            prop_match = PROP_PATTERN.match(line.strip())
-            if prop_match:
-                name, type_hint, default = prop_match.groups()
-                if default:
-                    _emit_with_mapping(ctx, f"{name}: {type_hint} = {default}")
-                else:
-                    _emit_with_mapping(ctx, f"{name}: {type_hint}")
-                continue
-
-        # Control flow: if
-        if_match = IF_PATTERN.match(line)
-        if if_match:
-            indent, _, condition = if_match.groups()
-            _emit_with_mapping(ctx, f"{indent}if {condition}:")
-            continue
-
-        # Control flow: elif
-        elif_match = ELIF_PATTERN.match(line)
-        if elif_match:
-            indent, _, condition = elif_match.groups()
-            _emit_with_mapping(ctx, f"{indent}elif {condition}:")
-            continue
-
-        # Control flow: else
-        else_match = ELSE_PATTERN.match(line)
-        if else_match:
-            indent, _ = else_match.groups()
-            _emit_with_mapping(ctx, f"{indent}else:")
-            continue
-
-        # Control flow: for
-        for_match = FOR_PATTERN.match(line)
-        if for_match:
-            indent, _, var, _, iterable = for_match.groups()
-            _emit_with_mapping(ctx, f"{indent}for {var} in {iterable}:")
-            continue
-
-        # Control flow: match
-        match_match = MATCH_PATTERN.match(line)
-        if match_match:
-            indent, _, subject = match_match.groups()
-            _emit_with_mapping(ctx, f"{indent}match {subject}:")
-            continue
-
-        # Control flow: case
-        case_match = CASE_PATTERN.match(line)
-        if case_match:
-            indent, _, pattern = case_match.groups()
-            _emit_with_mapping(ctx, f"{indent}case {pattern}:")
-            continue
-
-        # Control flow: end
-        end_match = END_PATTERN.match(line)
-        if end_match:
-            indent = end_match.group(1)
-            # 'end' becomes 'pass' if the previous line was a control statement
-            # or we just skip it and Python's indentation handles the rest
-            _emit_with_mapping(ctx, f"{indent}pass  # end")
-            continue
-
-        # HTML element
-        html_match = HTML_TAG_PATTERN.match(line)
-        if html_match:
-            indent = html_match.group(1)
-            # Convert to __h__ call, extracting any expressions
-            py_line = _transform_html_line(line, indent)
-            _emit_with_mapping(ctx, py_line)
-            continue
-
-        # Expression line (just {something})
-        if line.strip().startswith('{') and line.strip().endswith('}'):
-            indent = len(line) - len(line.lstrip())
-            expr = line.strip()[1:-1]
-            _emit_with_mapping(ctx, " " * indent + f"__h__({expr})")
-            continue
-
-        # Fallback: emit as comment
-        _emit_with_mapping(ctx, f"# {line}")
+        key = (in_props, line)
+        entry = line_cache.get(key) or previous.get(key)
+        if entry is None:
+            entry = _transform_line(line, in_props)
+        line_cache[key] = entry
+
+        leaves_props, py_line = entry
+        if leaves_props:
+            in_props = False
+            _emit(ctx, "")  # Add separator after props
+        _emit_with_mapping(ctx, py_line)
+
+    ctx.source_map.set_line_mappings(ctx.python_lines)
 
     return TransformResult(
         python_code='\n'.join(ctx.output_lines),
-        source_map=ctx.source_map
+        source_map=ctx.source_map,
+        line_cache=line_cache,
     )
 
 
-def _is_control_flow(line: str) -> bool:
-    """Check if a line is a control flow statement."""
+def _transform_line(line: str, in_props: bool) -> tuple[bool, str]:
+    """
+    Transform a single .hyper line.
+
+    Returns (leaves_props, python_line), where leaves_props is True when this
+    line ends the props section.
+    """
+    # Scan the line's whitespace once; every check below reuses these
     stripped = line.strip()
-    return any([
-        IF_PATTERN.match(line),
-        ELIF_PATTERN.match(line),
-        ELSE_PATTERN.match(line),
-        FOR_PATTERN.match(line),
-        MATCH_PATTERN.match(line),
-        CASE_PATTERN.match(line),
-        END_PATTERN.match(line),
-    ])
+
+    # Empty line
+    if not stripped:
+        return False, ""
+
+    indent_len = len(line) - len(line.lstrip())
+    line_match = LINE_PATTERN.match(line, indent_len)
+    kind = line_match.lastgroup if line_match else None
+
+    # Check if we've left props section (first HTML or control flow)
+    leaves_props = False
+    if in_props:
+        if stripped.startswith('<') or kind in CONTROL_FLOW:
+            in_props = False
+            leaves_props = True
+
+    # Props
+    if in_props:
+        prop_match = PROP_PATTERN.match(stripped)
+        if prop_match:
+            name, type_hint, default = prop_match.groups()
+            if default:
+                return leaves_props, f"{name}: {type_hint} = {default}"
+            return leaves_props, f"{name}: {type_hint}"
+
+    # Control flow: if/elif/else/for/match/case/end
+    if kind in CONTROL_FLOW:
+        return leaves_props, CONTROL_FLOW[kind](line[:indent_len], line_match)
+
+    # HTML element
+    if kind == 'html':
+        # Convert to __h__ call, extracting any expressions
+        return leaves_props, _transform_html_line(stripped, line[:indent_len])
+
+    # Expression line (just {something})
+    if stripped.startswith('{') and stripped.endswith('}'):
+        return leaves_props, f"{_indent(indent_len)}__h__({stripped[1:-1]})"
+
+    # Fallback: emit as comment
+    return leaves_props, f"# {line}"
 
 
 def _emit(ctx: TransformContext, line: str) -> None:
@@ -211,24 +216,23 @@ def _emit(ctx: TransformContext, line: str) -> None:
 
 
 def _emit_with_mapping(ctx: TransformContext, line: str) -> None:
-    """Emit a line and add source map entry."""
+    """Emit the output line for the current .hyper line and record its mapping."""
     ctx.output_lines.append(line)
-    ctx.source_map.add_line_mapping(ctx.current_hyper_line, ctx.current_python_line)
+    ctx.python_lines.append(ctx.current_python_line)
     ctx.current_python_line += 1
 
 
-def _transform_html_line(line: str, indent: str) -> str:
+def _transform_html_line(stripped: str, indent: str) -> str:
     """
-    Transform an HTML line to a Python __h__() call.
+    Transform an HTML line (without surrounding whitespace) to a Python __h__() call.
 
     Extracts expressions from {brackets} and makes them Python arguments.
     """
     # Simple approach: wrap the whole line in __h__()
-    # Extract expressions for type checking
-    expressions = EXPRESSION_PATTERN.findall(line)
-    if expressions:
-        # Create a call that references the expressions
-        expr_str = ', '.join(expressions)
-        return f"{indent}__h__({expr_str})  # {line.strip()}"
-    else:
-        return f"{indent}__h__()  # {line.strip()}"
+    # Extract expressions for type checking; most tags have none, and a plain
+    # substring check skips the regex for them
+    if '{' not in stripped:
+        return f"{indent}__h__()  # {stripped}"
+    # One regex pass; an empty match list gives a bare __h__() call
+    expr_str = ', '.join(EXPRESSION_PATTERN.findall(stripped))
+    return f"{indent}__h__({expr_str})  # {stripped}"
@@ -4,9 +4,13 @@ Templates are Python files with props (type hints) and slots ({...}).
 Props are HTML-escaped; children are trusted.
 """
 
+import os
+import re
 import sys
-import importlib
+import importlib.machinery
 import importlib.util
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
 
 from hyper.templates.component import Template, load_template, render  # noqa: E402
@@ -22,6 +26,24 @@ from hyper.templates.slots import slot  # noqa: E402
 from hyper.templates import context  # noqa: E402
 
 
+# Modules whose frames sit between the importing module and _do_enable:
+# hyper (including hyper.templates) and the import machinery
+_SKIP_PREFIXES = ("hyper", "importlib", "_frozen_importlib")
+
+
+@lru_cache(maxsize=512)
+def _get_possible_filenames(name: str) -> tuple[str, ...]:
+    """Get possible filenames for a template name."""
+    if name[0].isupper():
+        snake = "".join(
+            ["_" + c.lower() if c.isupper() else c for c in name]
+        ).lstrip("_")
+        return (f"{name}.py", f"{name.lower()}.py", f"{snake}.py")
+    else:
+        pascal = "".join(w.capitalize() for w in name.split("_"))
+        return (f"{name}.py", f"{pascal}.py")
+
+
 class _TemplateLoader:
     """Custom loader that returns a Template instead of a module."""
 
@@ -45,46 +67,157 @@ class _TemplateFinder:
     Template instances instead.
     """
 
-    def __init__(self, package_name: str, package_dir: "Path", is_excluded):
+    def __init__(self, package_name: str, package_dir: "Path", exclude=()):
         self.package_name = package_name
+        # Checked by find_spec for every import in the process
+        self._prefix = sys.intern(package_name + ".")
+        self._prefix_len = len(self._prefix)
         self.package_dir = package_dir
-        self.is_excluded = is_excluded
+        # The exclude globs, and the filename predicate built from them
+        self.exclude = tuple(exclude)
+        self.is_excluded = _exclude_matcher(exclude)
+        self._spec_cache: dict[str, importlib.machinery.ModuleSpec | None] = {}
+        # Files in the package, read once so lookups are set tests, not stats.
+        # Like importlib's FileFinder, rescanned when the directory's mtime changes.
+        self._dir_mtime: int | None = None
+        self._dir_snapshot: frozenset[str] = frozenset()
+        self._refresh_if_changed()
+
+    def _refresh_if_changed(self) -> None:
+        try:
+            mtime = os.stat(self.package_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._dir_mtime:
+            self.invalidate_caches()
+            self._dir_mtime = mtime
+
+    def has_file(self, filename: str) -> bool:
+        """Check whether the package directory contains filename."""
+        if filename in self._dir_snapshot:
+            return True
+        # Possibly created since the last scan
+        self._refresh_if_changed()
+        return filename in self._dir_snapshot
+
+    def set_exclude(self, exclude) -> None:
+        """Replace the exclude globs, dropping lookups made with the old ones."""
+        self.exclude = tuple(exclude)
+        self.is_excluded = _exclude_matcher(exclude)
+        self._spec_cache.clear()
+
+    def iter_template_files(self):
+        """Yield the filename of every template in the package, in sorted order."""
+        self._refresh_if_changed()
+        for filename in sorted(self._dir_snapshot):
+            stem, ext = os.path.splitext(filename)
+            if ext == ".py" and stem != "__init__" and not self.is_excluded(filename):
+                yield filename
+
+    def invalidate_caches(self):
+        """Forget cached lookups and rescan the package directory.
+
+        Also called by importlib.invalidate_caches().
+        """
+        self._spec_cache.clear()
+        try:
+            with os.scandir(self.package_dir) as entries:
+                self._dir_snapshot = frozenset(
+                    entry.name for entry in entries if entry.is_file()
+                )
+        except OSError:
+            self._dir_snapshot = frozenset()
 
     def find_spec(self, fullname: str, path=None, target=None):
         """Check if this import should be handled by us."""
-        if not fullname.startswith(self.package_name + "."):
+        if not fullname.startswith(self._prefix):
             return None
 
+        spec = self._spec_cache.get(fullname)
+        if spec is not None:
+            if os.path.isfile(spec.origin):
+                return spec
+            # Deleted since it was found: the snapshot is stale too
+            self.invalidate_caches()
+
+        # Cached misses only hold while the directory is unchanged
+        self._refresh_if_changed()
+        if fullname not in self._spec_cache:
+            self._spec_cache[fullname] = self._find_template_spec(fullname)
+        return self._spec_cache[fullname]
+
+    def _find_template_spec(self, fullname: str):
         # Get the name after the package prefix
-        name = fullname[len(self.package_name) + 1 :]
+        name = fullname[self._prefix_len :]
 
         # Only handle direct children (no dots)
         if "." in name:
             return None
 
         # Check if there's a matching template file
-        possible = self._get_possible_filenames(name)
+        possible = _get_possible_filenames(name)
         for filename in possible:
-            if not self.is_excluded(filename):
+            if not self.is_excluded(filename) and filename in self._dir_snapshot:
                 template_path = self.package_dir / filename
-                if template_path.exists():
-                    loader = _TemplateLoader(template_path)
-                    return importlib.util.spec_from_loader(
-                        fullname, loader, origin=str(template_path)
-                    )
+                # The snapshot may predate a deletion within the same mtime tick
+                if not template_path.is_file():
+                    continue
+                loader = _TemplateLoader(template_path)
+                return importlib.util.spec_from_loader(
+                    fullname, loader, origin=str(template_path)
+                )
 
         return None
 
-    def _get_possible_filenames(self, name: str) -> list:
-        """Get possible filenames for a template name."""
-        if name[0].isupper():
-            snake = "".join(
-                ["_" + c.lower() if c.isupper() else c for c in name]
-            ).lstrip("_")
-            return [f"{name}.py", f"{name.lower()}.py", f"{snake}.py"]
-        else:
-            pascal = "".join(w.capitalize() for w in name.split("_"))
-            return [f"{name}.py", f"{pascal}.py"]
+
+class _ModuleGetattr:
+    """Module-level __getattr__ that loads templates on attribute access."""
+
+    __slots__ = ("finder", "module", "package_dir")
+
+    def __init__(self, finder: _TemplateFinder, package_dir: Path, module):
+        self.finder = finder
+        self.package_dir = package_dir
+        self.module = module
+
+    def __call__(self, name: str):
+        # Map import name to possible filenames
+        possible = _get_possible_filenames(name)
+
+        for filename in possible:
+            if not self.finder.is_excluded(filename) and self.finder.has_file(filename):
+                tmpl = load_template(self.package_dir / filename)
+                setattr(self.module, name, tmpl)
+                return tmpl
+
+        raise AttributeError(f"No template '{name}' in {self.module.__name__}")
+
+
+def _exclude_matcher(exclude):
+    """Build the filename predicate for a list of exclude globs."""
+    if not exclude:
+
+        def is_excluded(filename):
+            return False
+
+        return is_excluded
+
+    # All exclude globs as one regex, compiled once per package
+    match_excluded = re.compile(
+        "|".join(translate(os.path.normcase(p)) for p in exclude)
+    ).match
+
+    def is_excluded(filename):
+        return match_excluded(os.path.normcase(filename)) is not None
+
+    return is_excluded
+
+
+def _preload_templates(finder: _TemplateFinder, module) -> None:
+    """Load every template in the package now and bind it by file stem."""
+    for filename in finder.iter_template_files():
+        stem = os.path.splitext(filename)[0]
+        setattr(module, stem, load_template(finder.package_dir / filename))
 
 
 class _EnableTemplates:
@@ -98,36 +231,40 @@ class _EnableTemplates:
         # app/templates/__init__.py
         from hyper import enable_templates
         enable_templates(exclude=["old_*.py"])
+
+    Usage - load all templates up front (long-running servers):
+        # app/templates/__init__.py
+        from hyper import enable_templates
+        enable_templates(preload=True)
+
+    Preloading compiles every template once at startup instead of on first
+    use. Leave it off while developing, so edited templates are picked up.
     """
 
     def __init__(self):
-        self._enabled_modules = set()
-        self._finders = {}
+        # Finder per enabled package, also what makes enabling idempotent
+        self._finders: dict[str, _TemplateFinder] = {}
 
-    def __call__(self, exclude=None):
-        """Call explicitly with exclusions."""
-        self._do_enable(exclude=exclude)
+    def __call__(self, exclude=None, preload=False):
+        """Call explicitly with exclusions or preloading."""
+        self._do_enable(exclude=exclude, preload=preload)
         return self
 
-    def _do_enable(self, exclude=None):
-        import inspect
-        from pathlib import Path
-        from fnmatch import fnmatch
-
+    def _do_enable(self, exclude=None, preload=False, depth=2):
         exclude = exclude or []
 
-        # Get the caller - walk back to find the importing module
-        # Skip our own frames and internal Python frames
-        frame = inspect.currentframe().f_back
+        # Get the caller. Every entry point (__call__ and both module
+        # __getattr__ hooks) calls us directly, so the importing module is
+        # normally `depth` frames up and the walk below stops at once.
+        try:
+            frame = sys._getframe(depth)
+        except ValueError:
+            frame = sys._getframe(1)
+
+        # Otherwise walk back, skipping our own frames and internal Python frames
         while frame:
             module_name = frame.f_globals.get("__name__", "")
-            # Skip hyper.templates, hyper, and importlib frames
-            if (
-                module_name.startswith("hyper.templates")
-                or module_name.startswith("hyper")
-                or module_name.startswith("importlib")
-                or module_name.startswith("_frozen_importlib")
-            ):
+            if module_name.startswith(_SKIP_PREFIXES):
                 frame = frame.f_back
                 continue
             break
@@ -141,43 +278,34 @@ class _EnableTemplates:
 
         caller_module_name = frame.f_globals["__name__"]
 
-        # Don't enable twice
-        if caller_module_name in self._enabled_modules:
+        # Don't enable twice. New template files are picked up anyway, since
+        # the finder rescans when the package directory changes.
+        finder = self._finders.get(caller_module_name)
+        if finder is not None:
+            if exclude and tuple(exclude) != finder.exclude:
+                # `from hyper import enable_templates` already enabled the
+                # package, so exclusions arrive with the follow-up call
+                finder.set_exclude(exclude)
+            if preload:
+                _preload_templates(finder, sys.modules[caller_module_name])
             return
 
-        self._enabled_modules.add(caller_module_name)
-
         caller_file = Path(frame.f_globals["__file__"])
         package_dir = caller_file.parent
 
         caller_module = sys.modules[caller_module_name]
 
-        def is_excluded(filename):
-            return any(fnmatch(filename, p) for p in exclude)
-
         # Install custom import finder
-        finder = _TemplateFinder(caller_module_name, package_dir, is_excluded)
+        finder = _TemplateFinder(caller_module_name, package_dir, exclude)
         self._finders[caller_module_name] = finder
+        # First on meta_path, so it already takes precedence over the path finders
         sys.meta_path.insert(0, finder)
-        # Invalidate caches so our finder takes precedence
-        importlib.invalidate_caches()
 
         # Also set up __getattr__ for attribute access (e.g., templates.Button)
-        def __getattr__(name):
-            # Map import name to possible filenames
-            possible = finder._get_possible_filenames(name)
-
-            for filename in possible:
-                if not is_excluded(filename):
-                    path = package_dir / filename
-                    if path.exists():
-                        tmpl = load_template(path)
-                        setattr(caller_module, name, tmpl)
-                        return tmpl
-
-            raise AttributeError(f"No template '{name}' in {caller_module_name}")
+        caller_module.__getattr__ = _ModuleGetattr(finder, package_dir, caller_module)
 
-        caller_module.__getattr__ = __getattr__
+        if preload:
+            _preload_templates(finder, caller_module)
 
 
 _enable_templates_instance = _EnableTemplates()
@@ -1,9 +1,9 @@
-import sys
 import typing as t
 from string.templatelib import Template, Interpolation
 from html.parser import HTMLParser
 from dataclasses import dataclass, field
-from functools import lru_cache
+from collections import OrderedDict
+from threading import Lock
 
 from .nodes import (
     VOID_ELEMENTS,
@@ -31,6 +31,19 @@ from .placeholders import (
     FRAGMENT_TAG,
 )
 
+# Directive keyword -> (TemplateParser method, whether it takes an argument)
+_DIRECTIVE_HANDLERS: dict[str, tuple[str, bool]] = {
+    "if": ("handle_directive_if", True),
+    "elif": ("handle_directive_elif", True),
+    "else": ("handle_directive_else", False),
+    "match": ("handle_directive_match", True),
+    "case": ("handle_directive_case", True),
+    "end": ("handle_directive_end", False),
+}
+
+# Tag name -> Template for tags without placeholders (div, span, li, ...)
+_STATIC_TAG_TEMPLATES: dict[str, Template] = {}
+
 type OpenTag = (
     OpenTElement | OpenTFragment | OpenTComponent | OpenTConditional | OpenTMatch
 )
@@ -58,18 +71,24 @@ class OpenTComponent:
 
 @dataclass
 class OpenTConditional:
-    """Tracks state while parsing if/elif/else directives."""
+    """Tracks state while parsing if/elif/else directives.
+
+    Branches stay (condition_index, children) pairs until the `end` directive.
+    """
 
-    branches: list[TConditionalBranch] = field(default_factory=list)
+    branches: list[tuple[int | None, list[TNode]]] = field(default_factory=list)
     current_branch_children: list[TNode] = field(default_factory=list)
 
 
 @dataclass
 class OpenTMatch:
-    """Tracks state while parsing match/case directives."""
+    """Tracks state while parsing match/case directives.
+
+    Cases stay (pattern_index, children) pairs until the `end` directive.
+    """
 
     subject_index: int
-    cases: list[TCase] = field(default_factory=list)
+    cases: list[tuple[int, list[TNode]]] = field(default_factory=list)
     current_case_children: list[TNode] | None = None
 
 
@@ -79,8 +98,16 @@ class TemplateState:
     root: OpenTFragment = field(default_factory=OpenTFragment)
     stack: list[OpenTag] = field(default_factory=list)
     active_placeholders: dict[str, int] = field(default_factory=dict)
+    # id(TText) -> (node, pieces) for text split across several handle_data calls
+    text_runs: dict[int, tuple[TText, list[Template]]] = field(default_factory=dict)
     strings_index: int = -1
     interpolations_index: int = -1
+    # List that new children go to, kept in step with `stack`.
+    # None while an open match has no case yet.
+    children: list[TNode] | None = None
+
+    def __post_init__(self):
+        self.children = self.root.children
 
     @property
     def interpolations(self):
@@ -91,7 +118,7 @@ class TemplateParser(HTMLParser):
     tstate: TemplateState
 
     def __init__(self, *, convert_charrefs=True):
-        self.tstate = TemplateState()
+        # HTMLParser.__init__ calls reset(), which sets up self.tstate
         super().__init__(convert_charrefs=convert_charrefs)
 
     def handle_attrs(
@@ -133,27 +160,27 @@ class TemplateParser(HTMLParser):
         self, tag: str, attrs: t.Sequence[tuple[str, str | None]]
     ) -> None:
         """Dispatch *opening* a tag specialized handlers."""
-        tag_t = list(self.extract_template(tag, ""))
-        match tag_t:
-            case [Interpolation(value=interpolation_index)]:
-                open_component = self.handle_start_component(interpolation_index, attrs)
-                self.tstate.stack.append(open_component)
-            case [str()]:
-                if tag == FRAGMENT_TAG:
-                    open_fragment = self.handle_start_fragment(tag, attrs)
-                    self.tstate.stack.append(open_fragment)
+        tag_t = self.extract_tag_template(tag)
+        if _is_component_tag(tag_t):
+            interpolation_index = tag_t.interpolations[0].value
+            open_component = self.handle_start_component(interpolation_index, attrs)
+            self.push_open_tag(open_component)
+        elif not tag_t.interpolations:
+            if tag == FRAGMENT_TAG:
+                open_fragment = self.handle_start_fragment(tag, attrs)
+                self.push_open_tag(open_fragment)
+            else:
+                open_element = self.handle_start_element(tag, attrs)
+                if open_element.tag in VOID_ELEMENTS:
+                    self.append_child(
+                        TElement(tag=open_element.tag, attrs=open_element.attrs)
+                    )
                 else:
-                    open_element = self.handle_start_element(tag, attrs)
-                    if open_element.tag in VOID_ELEMENTS:
-                        self.append_child(
-                            TElement(tag=open_element.tag, attrs=open_element.attrs)
-                        )
-                    else:
-                        self.tstate.stack.append(open_element)
-            case _:
-                raise ValueError(
-                    "Component tags should be an exact match."
-                )  # @TODO: Cleanup
+                    self.push_open_tag(open_element)
+        else:
+            raise ValueError(
+                "Component tags should be an exact match."
+            )  # @TODO: Cleanup
 
     def handle_start_fragment(
         self, tag: str, attrs: t.Sequence[tuple[str, str | None]]
@@ -188,22 +215,22 @@ class TemplateParser(HTMLParser):
         self, tag: str, attrs: t.Sequence[tuple[str, str | None]]
     ) -> None:
         """Dispatch a self-closing tag, `<tag />` to specialized handlers."""
-        tag_t = list(self.extract_template(tag, ""))
-        match tag_t:
-            case [Interpolation(value=interpolation_index)]:
-                component = self.handle_startend_component(interpolation_index, attrs)
-                self.append_child(component)
-            case [str() as starttag]:
-                if starttag == FRAGMENT_TAG:
-                    fragment = self.handle_startend_fragment(starttag, attrs)
-                    self.append_child(fragment)
-                else:
-                    element = self.handle_startend_element(starttag, attrs)
-                    self.append_child(element)
-            case _:
-                raise ValueError(
-                    "Component tags should be an exact match."
-                )  # @TODO: Cleanup
+        tag_t = self.extract_tag_template(tag)
+        if _is_component_tag(tag_t):
+            interpolation_index = tag_t.interpolations[0].value
+            component = self.handle_startend_component(interpolation_index, attrs)
+            self.append_child(component)
+        elif not tag_t.interpolations:
+            if tag == FRAGMENT_TAG:
+                fragment = self.handle_startend_fragment(tag, attrs)
+                self.append_child(fragment)
+            else:
+                element = self.handle_startend_element(tag, attrs)
+                self.append_child(element)
+        else:
+            raise ValueError(
+                "Component tags should be an exact match."
+            )  # @TODO: Cleanup
 
     def handle_startend_fragment(
         self, startendtag: str, attrs: t.Sequence[tuple[str, str | None]]
@@ -238,27 +265,27 @@ class TemplateParser(HTMLParser):
 
     def handle_endtag(self, tag: str) -> None:
         """Dispatch *closing* a tag, `</tag>`, to specialized handlers."""
-        tag_t = list(self.extract_template(tag, ""))
-        match tag_t:
-            case [Interpolation(value=interpolation_index)]:
-                component = self.handle_end_component(interpolation_index)
-                self.append_child(component)
-            case [str()]:
-                if tag == FRAGMENT_TAG:
-                    fragment = self.handle_end_fragment(tag)
-                    self.append_child(fragment)
-                else:
-                    element = self.handle_end_element(tag)
-                    self.append_child(element)
-            case _:
-                raise ValueError("Component end tag must be an exact match.")
+        tag_t = self.extract_tag_template(tag)
+        if _is_component_tag(tag_t):
+            interpolation_index = tag_t.interpolations[0].value
+            component = self.handle_end_component(interpolation_index)
+            self.append_child(component)
+        elif not tag_t.interpolations:
+            if tag == FRAGMENT_TAG:
+                fragment = self.handle_end_fragment(tag)
+                self.append_child(fragment)
+            else:
+                element = self.handle_end_element(tag)
+                self.append_child(element)
+        else:
+            raise ValueError("Component end tag must be an exact match.")
 
     def handle_end_component(self, interpolation_index: int) -> TComponent:
         if not self.tstate.stack:
             raise ValueError(
                 f"Unexpected closing tag </{self.get_comp_endtag(interpolation_index)}> with no open tag."
             )
-        open_tag = self.tstate.stack.pop()
+        open_tag = self.pop_open_tag()
         match open_tag:
             case OpenTElement():
                 raise TypeError(
@@ -291,7 +318,7 @@ class TemplateParser(HTMLParser):
     def handle_end_element(self, tag: str) -> TElement:
         if not self.tstate.stack:
             raise ValueError(f"Unexpected closing tag </{tag}> with no open tag.")
-        open_tag = self.tstate.stack.pop()
+        open_tag = self.pop_open_tag()
         match open_tag:
             case OpenTElement():
                 if open_tag.tag != tag:
@@ -315,7 +342,7 @@ class TemplateParser(HTMLParser):
     def handle_end_fragment(self, tag: str) -> TFragment:
         if not self.tstate.stack:
             raise ValueError("Unexpected closing tag </> with no open tag.")
-        open_tag = self.tstate.stack.pop()
+        open_tag = self.pop_open_tag()
         match open_tag:
             case OpenTFragment():
                 return TFragment(children=tuple(open_tag.children))
@@ -332,7 +359,16 @@ class TemplateParser(HTMLParser):
         text_t = self.extract_template(data)
         last_text_child = self.get_latest_text_child()
         if last_text_child:
-            last_text_child.text_t += text_t
+            # Collect the pieces and join them once in join_text_runs(),
+            # since each Template += copies everything merged so far
+            run = self.tstate.text_runs.get(id(last_text_child))
+            if run is None:
+                self.tstate.text_runs[id(last_text_child)] = (
+                    last_text_child,
+                    [last_text_child.text_t, text_t],
+                )
+            else:
+                run[1].append(text_t)
         else:
             text = TText(text_t)
             self.append_child(text)
@@ -353,20 +389,15 @@ class TemplateParser(HTMLParser):
 
     def handle_directive_comment(self, directive: str) -> None:
         """Parse and handle directive comments like <!--@ if {cond} -->"""
-        if directive.startswith("if "):
-            self.handle_directive_if(directive[3:].strip())
-        elif directive.startswith("elif "):
-            self.handle_directive_elif(directive[5:].strip())
-        elif directive == "else":
-            self.handle_directive_else()
-        elif directive.startswith("match "):
-            self.handle_directive_match(directive[6:].strip())
-        elif directive.startswith("case "):
-            self.handle_directive_case(directive[5:].strip())
-        elif directive == "end":
-            self.handle_directive_end()
-        else:
+        keyword, sep, argument = directive.partition(" ")
+        handler = _DIRECTIVE_HANDLERS.get(keyword)
+        # Directives either take an argument (`if {cond}`) or are bare (`else`)
+        if handler is None or bool(sep) != handler[1]:
             raise ValueError(f"Unknown directive: {directive}")
+        if sep:
+            getattr(self, handler[0])(argument.strip())
+        else:
+            getattr(self, handler[0])()
 
     def handle_directive_if(self, condition_expr: str) -> None:
         """Handle <!--@ if {condition} -->"""
@@ -383,9 +414,9 @@ class TemplateParser(HTMLParser):
         # Create a new conditional with the first branch
         open_conditional = OpenTConditional()
         open_conditional.branches.append(
-            TConditionalBranch(condition_index=condition_index, children=tuple())
+            (condition_index, open_conditional.current_branch_children)
         )
-        self.tstate.stack.append(open_conditional)
+        self.push_open_tag(open_conditional)
 
     def handle_directive_elif(self, condition_expr: str) -> None:
         """Handle <!--@ elif {condition} -->"""
@@ -396,10 +427,7 @@ class TemplateParser(HTMLParser):
 
         open_conditional = self.tstate.stack[-1]
         # Check if we already have an else branch (condition_index=None)
-        if (
-            open_conditional.branches
-            and open_conditional.branches[-1].condition_index is None
-        ):
+        if open_conditional.branches and open_conditional.branches[-1][0] is None:
             raise ValueError("elif directive cannot come after else")
 
         condition_t = self.extract_template(condition_expr)
@@ -411,15 +439,10 @@ class TemplateParser(HTMLParser):
 
         condition_index = condition_t.interpolations[0].value
 
-        # Finalize current branch
-        open_conditional.branches[-1] = TConditionalBranch(
-            condition_index=open_conditional.branches[-1].condition_index,
-            children=tuple(open_conditional.current_branch_children),
-        )
         # Start new elif branch
-        open_conditional.current_branch_children = []
+        open_conditional.current_branch_children = self.tstate.children = []
         open_conditional.branches.append(
-            TConditionalBranch(condition_index=condition_index, children=tuple())
+            (condition_index, open_conditional.current_branch_children)
         )
 
     def handle_directive_else(self) -> None:
@@ -431,21 +454,13 @@ class TemplateParser(HTMLParser):
 
         open_conditional = self.tstate.stack[-1]
         # Check if we already have an else branch
-        if (
-            open_conditional.branches
-            and open_conditional.branches[-1].condition_index is None
-        ):
+        if open_conditional.branches and open_conditional.branches[-1][0] is None:
             raise ValueError("multiple else clauses not allowed")
 
-        # Finalize current branch
-        open_conditional.branches[-1] = TConditionalBranch(
-            condition_index=open_conditional.branches[-1].condition_index,
-            children=tuple(open_conditional.current_branch_children),
-        )
         # Start else branch (condition_index=None)
-        open_conditional.current_branch_children = []
+        open_conditional.current_branch_children = self.tstate.children = []
         open_conditional.branches.append(
-            TConditionalBranch(condition_index=None, children=tuple())
+            (None, open_conditional.current_branch_children)
         )
 
     def handle_directive_match(self, subject_expr: str) -> None:
@@ -460,7 +475,7 @@ class TemplateParser(HTMLParser):
         subject_index = subject_t.interpolations[0].value
 
         open_match = OpenTMatch(subject_index=subject_index)
-        self.tstate.stack.append(open_match)
+        self.push_open_tag(open_match)
 
     def handle_directive_case(self, pattern_expr: str) -> None:
         """Handle <!--@ case {pattern} -->"""
@@ -477,15 +492,9 @@ class TemplateParser(HTMLParser):
         pattern_index = pattern_t.interpolations[0].value
 
         open_match = self.tstate.stack[-1]
-        # Finalize previous case if any
-        if open_match.current_case_children is not None:
-            open_match.cases[-1] = TCase(
-                pattern_index=open_match.cases[-1].pattern_index,
-                children=tuple(open_match.current_case_children),
-            )
         # Start new case
-        open_match.current_case_children = []
-        open_match.cases.append(TCase(pattern_index=pattern_index, children=tuple()))
+        open_match.current_case_children = self.tstate.children = []
+        open_match.cases.append((pattern_index, open_match.current_case_children))
 
     def handle_directive_end(self) -> None:
         """Handle <!--@ end -->"""
@@ -499,27 +508,25 @@ class TemplateParser(HTMLParser):
         if control_flow_index is None:
             raise ValueError("end directive without matching control flow directive")
 
-        open_tag = self.tstate.stack.pop(control_flow_index)
+        open_tag = self.pop_open_tag(control_flow_index)
 
         if isinstance(open_tag, OpenTConditional):
-            # Finalize the last branch
-            open_tag.branches[-1] = TConditionalBranch(
-                condition_index=open_tag.branches[-1].condition_index,
-                children=tuple(open_tag.current_branch_children),
+            # Freeze every branch at once
+            conditional = TConditional(
+                branches=tuple(
+                    TConditionalBranch(condition_index=index, children=tuple(children))
+                    for index, children in open_tag.branches
+                )
             )
-            # Create the TConditional node
-            conditional = TConditional(branches=tuple(open_tag.branches))
             self.append_child(conditional)
         elif isinstance(open_tag, OpenTMatch):
-            # Finalize the last case
-            if open_tag.current_case_children is not None:
-                open_tag.cases[-1] = TCase(
-                    pattern_index=open_tag.cases[-1].pattern_index,
-                    children=tuple(open_tag.current_case_children),
-                )
-            # Create the TMatch node
+            # Freeze every case at once
             match_node = TMatch(
-                subject_index=open_tag.subject_index, cases=tuple(open_tag.cases)
+                subject_index=open_tag.subject_index,
+                cases=tuple(
+                    TCase(pattern_index=index, children=tuple(children))
+                    for index, children in open_tag.cases
+                ),
             )
             self.append_child(match_node)
 
@@ -533,50 +540,41 @@ class TemplateParser(HTMLParser):
 
     def get_latest_text_child(self) -> TText | None:
         """Get the latest text child of the current parent or None if one does not exist."""
-        parent = self.get_parent()
-        # Get the appropriate children list based on parent type
-        if isinstance(parent, OpenTConditional):
-            children = parent.current_branch_children
-        elif isinstance(parent, OpenTMatch):
-            children = (
-                parent.current_case_children
-                if parent.current_case_children is not None
-                else []
-            )
-        else:
-            children = parent.children
-
+        children = self.tstate.children
         if children and isinstance(children[-1], TText):
             return children[-1]
         return None
 
+    def push_open_tag(self, open_tag: OpenTag) -> None:
+        self.tstate.stack.append(open_tag)
+        self.tstate.children = _children_of(open_tag)
+
+    def pop_open_tag(self, index: int = -1) -> OpenTag:
+        stack = self.tstate.stack
+        open_tag = stack.pop(index)
+        self.tstate.children = _children_of(stack[-1] if stack else self.tstate.root)
+        return open_tag
+
     def get_parent(self) -> OpenTag:
         """Return the current parent node to which new children should be added."""
         return self.tstate.stack[-1] if self.tstate.stack else self.tstate.root
 
     def append_child(self, child: TNode) -> None:
-        parent = self.get_parent()
-        # Special handling for control flow directives
-        if isinstance(parent, OpenTConditional):
-            parent.current_branch_children.append(child)
-        elif isinstance(parent, OpenTMatch):
-            if parent.current_case_children is not None:
-                parent.current_case_children.append(child)
-            else:
-                # Ignore whitespace-only text before first case
-                if isinstance(child, TText):
-                    # Check if it's only whitespace
-                    is_whitespace_only = all(
-                        isinstance(part, str) and part.strip() == ""
-                        for part in child.text_t
-                    )
-                    if is_whitespace_only:
-                        return  # Silently ignore whitespace before first case
-                raise ValueError(
-                    "match directive requires at least one case before content"
-                )
-        else:
-            parent.children.append(child)
+        children = self.tstate.children
+        if children is not None:
+            children.append(child)
+            return
+
+        # Only an open match without a case yet has nowhere to put children.
+        # Ignore whitespace-only text before first case
+        if isinstance(child, TText):
+            # Check if it's only whitespace
+            is_whitespace_only = all(
+                isinstance(part, str) and part.strip() == "" for part in child.text_t
+            )
+            if is_whitespace_only:
+                return  # Silently ignore whitespace before first case
+        raise ValueError("match directive requires at least one case before content")
 
     def close(self) -> None:
         if self.tstate.stack:
@@ -586,6 +584,13 @@ class TemplateParser(HTMLParser):
                 f"Some interpolations were never found: {list(self.tstate.active_placeholders.values())}"
             )
         super().close()
+        self.join_text_runs()
+
+    def join_text_runs(self) -> None:
+        """Give each TText that was fed in pieces its single, merged Template."""
+        for text, pieces in self.tstate.text_runs.values():
+            text.text_t = Template(*(part for piece in pieces for part in piece))
+        self.tstate.text_runs.clear()
 
     def get_node(
         self,
@@ -642,6 +647,16 @@ class TemplateParser(HTMLParser):
                 del self.tstate.active_placeholders[placeholder]
         return text_t
 
+    def extract_tag_template(self, tag: str) -> Template:
+        """Like extract_template, but plain tag names are served from a shared cache."""
+        tag_t = _STATIC_TAG_TEMPLATES.get(tag)
+        if tag_t is None:
+            tag_t = self.extract_template(tag, "")
+            # No placeholders means the result never depends on parser state
+            if not tag_t.interpolations and len(_STATIC_TAG_TEMPLATES) < 4096:
+                _STATIC_TAG_TEMPLATES[tag] = tag_t
+        return tag_t
+
     def reset(self):
         super().reset()
         self.tstate = TemplateState()
@@ -679,34 +694,43 @@ class TemplateParser(HTMLParser):
         )
 
 
-@lru_cache(maxsize=0 if "pytest" in sys.modules else 512)
+def _children_of(open_tag: OpenTag) -> list[TNode] | None:
+    """The list an open tag's next child goes to."""
+    if isinstance(open_tag, OpenTConditional):
+        return open_tag.current_branch_children
+    if isinstance(open_tag, OpenTMatch):
+        return open_tag.current_case_children
+    return open_tag.children
+
+
+def _is_component_tag(tag_t: Template) -> bool:
+    """Whether a tag name is exactly one interpolation, as in `<{Button}>`."""
+    return len(tag_t.interpolations) == 1 and tag_t.strings == ("", "")
+
+
+# Cap on cached parses; the least recently used is dropped first
+_PARSE_CACHE_SIZE = 512
+
+# Parsed nodes by template strings, least recently used first. A t-string
+# literal reuses the same strings tuple on every evaluation, and dict lookups
+# check identity before equality, so repeat parses of a literal are cheap.
+_PARSE_CACHE: OrderedDict[tuple[str, ...], TNode] = OrderedDict()
+
+# Templates render from worker threads; guards the lookup/refresh/evict steps
+_PARSE_CACHE_LOCK = Lock()
+
+
 def _parse_html(
-    cached_template: CachedTemplate,
+    template: Template,
 ) -> (
     TNode  # @TODO: Might be more consistent for this to always be a container.
 ):
     parser = TemplateParser()
-    parser.feed_template(cached_template.template)
+    parser.feed_template(template)
     parser.close()
     return parser.get_node()
 
 
-@dataclass
-class CachedTemplate:
-    """Attempt to cache template just by its strings."""
-
-    template: Template
-
-    def __hash__(self):
-        return hash(self.template.strings)
-
-    def __eq__(self, other):
-        return (
-            isinstance(other, CachedTemplate)
-            and self.template.strings == other.template.strings
-        )
-
-
 def parse_html(template: Template) -> TNode:
     """
     Parse a string, or sequence of HTML string chunks, into a Node tree.
@@ -716,4 +740,19 @@ def parse_html(template: Template) -> TNode:
     This is particularly useful if you want to keep specific text chunks
     separate in the resulting Node tree.
     """
-    return _parse_html(CachedTemplate(template))
+    # Templates are cached just by their strings
+    strings = template.strings
+    with _PARSE_CACHE_LOCK:
+        node = _PARSE_CACHE.get(strings)
+        if node is not None:
+            _PARSE_CACHE.move_to_end(strings)
+            return node
+
+    # Parse outside the lock; a racing parse of the same strings is harmless
+    node = _parse_html(template)
+    with _PARSE_CACHE_LOCK:
+        node = _PARSE_CACHE.setdefault(strings, node)
+        _PARSE_CACHE.move_to_end(strings)
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return node
@@ -5,10 +5,16 @@ The generated code uses f-strings and runtime utilities for efficient rendering.
 """
 
 import ast
+import hashlib
+import importlib.util
 import linecache
+import marshal
 import os
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import CodeType
 from typing import Any, Callable
 
 from markupsafe import Markup
@@ -52,6 +58,87 @@ def write_debug_file(path: Path, source: str) -> None:
     gen_path.write_text(source)
 
 
+@lru_cache(maxsize=1)
+def _codegen_stamp() -> bytes:
+    """Identify the code generator, so upgrading hyper invalidates cached output.
+
+    Covers every module in hyper.templates and its _tdom package, since the
+    parser, nodes, placeholders and prop loader all shape the generated code.
+    """
+    stamp = importlib.util.MAGIC_NUMBER
+    package_dir = Path(__file__).parent
+    for module_file in sorted(package_dir.glob("**/*.py")):
+        try:
+            mtime_ns = os.stat(module_file).st_mtime_ns
+        except OSError:
+            continue
+        name = module_file.relative_to(package_dir).as_posix()
+        stamp += f"\0{name}:{mtime_ns}".encode()
+    return stamp
+
+
+def _cache_path(path: Path) -> Path:
+    """Location of the compiled-template cache, next to Python's own .pyc files."""
+    cache_tag = sys.implementation.cache_tag
+    return path.parent / "__pycache__" / f"{path.stem}.{cache_tag}.hyper"
+
+
+def _cache_key(source: str, path: Path, props: dict[str, Prop]) -> bytes:
+    """Digest of everything the generated code depends on."""
+    h = hashlib.blake2b(_codegen_stamp(), digest_size=16)
+    h.update(str(path).encode())
+    h.update(source.encode())
+    # Props become the render() signature
+    for name, prop in props.items():
+        default = repr(prop.default) if prop.has_default else ""
+        h.update(f"\0{name}:{prop.type_name}={default}".encode())
+    return h.digest()
+
+
+def _read_cached_code(path: Path, key: bytes) -> tuple[str, CodeType] | None:
+    """Return (generated_source, code) from the on-disk cache, if still valid."""
+    if sys.implementation.cache_tag is None:
+        return None
+    try:
+        data = _cache_path(path).read_bytes()
+    except OSError:
+        return None
+    if not data.startswith(key):
+        return None
+    try:
+        cached = marshal.loads(data[len(key) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+    # Anything but what _write_cached_code stores counts as a miss
+    if (
+        type(cached) is not tuple
+        or len(cached) != 2
+        or type(cached[0]) is not str
+        or type(cached[1]) is not CodeType
+    ):
+        return None
+    return cached
+
+
+def _write_cached_code(path: Path, key: bytes, source: str, code: CodeType) -> None:
+    """Store generated source and its code object; failures only cost a recompile."""
+    # Same opt-outs as .pyc files (PYTHONDONTWRITEBYTECODE, python -B)
+    if sys.dont_write_bytecode or sys.implementation.cache_tag is None:
+        return
+    cache_path = _cache_path(path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        tmp_path.write_bytes(key + marshal.dumps((source, code)))
+        # Atomic, so concurrent processes never read a half-written file
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
 @dataclass
 class MockInterpolation:
     """Mock interpolation that provides expression info for codegen."""
@@ -104,29 +191,38 @@ class TemplateCompiler:
         Returns:
             Tuple of (render_function, generated_source)
         """
-        # Parse source and extract template structure + pre-template code
-        template, pre_template_stmts = self._extract_template_and_stmts()
-
-        if template is None:
-            # No t-string found - return a function that returns empty string
-            def empty_render(**kwargs):
-                return Markup("")
-
-            return empty_render, "def render(**kwargs): return Markup('')"
-
-        # Parse the HTML template into a TNode tree
-        tree = parse_html(template)
-
-        # Generate Python code from the tree
-        generated_source = generate_code(template, tree, self.props, pre_template_stmts)
+        # Generated code is cached on disk, so warm starts skip parsing entirely
+        key = _cache_key(self.source, self.path, self.props)
+        cached = _read_cached_code(self.path, key)
+        if cached is not None:
+            generated_source, code = cached
+        else:
+            # Parse source and extract template structure + pre-template code
+            template, pre_template_stmts = self._extract_template_and_stmts()
+
+            if template is None:
+                # No t-string found - return a function that returns empty string
+                def empty_render(**kwargs):
+                    return Markup("")
+
+                return empty_render, "def render(**kwargs): return Markup('')"
+
+            # Parse the HTML template into a TNode tree
+            tree = parse_html(template)
+
+            # Generate Python code from the tree
+            generated_source = generate_code(
+                template, tree, self.props, pre_template_stmts
+            )
+
+            # Compile the generated source
+            code = compile(generated_source, filename=str(self.path), mode="exec")
+            _write_cached_code(self.path, key, generated_source, code)
 
         # Write debug file if in debug mode
         if is_debug_mode():
             write_debug_file(self.path, generated_source)
 
-        # Compile the generated source
-        code = compile(generated_source, filename=str(self.path), mode="exec")
-
         # Register source with linecache for debugging
         linecache.cache[str(self.path)] = (
             len(generated_source),
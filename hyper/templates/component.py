@@ -1,8 +1,10 @@
 """Template system: Python files as reusable templates."""
 
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
+from threading import Lock
 from typing import Any, Callable
 
 from markupsafe import Markup
@@ -174,18 +176,53 @@ def _resolve_type(type_name: str, namespace: dict) -> type | None:
     return _BUILTIN_TYPES.get(type_name)
 
 
+# Loaded templates by resolved path, with the (mtime_ns, size) they were built from
+_TEMPLATE_CACHE: OrderedDict[Path, tuple[tuple[int, int], Template]] = OrderedDict()
+
+# Cap on cached templates; the least recently loaded is dropped first
+_TEMPLATE_CACHE_SIZE = 512
+
+# Templates load from worker threads; guards the lookup/refresh/evict steps
+_TEMPLATE_CACHE_LOCK = Lock()
+
+
 def load_template(path: Path | str) -> Template:
-    """Load Python file as callable template."""
+    """Load Python file as callable template.
+
+    Results are cached per file and rebuilt when its mtime or size changes.
+    """
+    path = Path(path).resolve()
+    try:
+        st = path.stat()
+    except OSError:
+        raise TemplateNotFoundError(
+            f"Template file not found: {path}", path=path
+        ) from None
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _TEMPLATE_CACHE_LOCK:
+        cached = _TEMPLATE_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            _TEMPLATE_CACHE.move_to_end(path)
+            return cached[1]
+
+    template = _compile_template(path)
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE[path] = (stamp, template)
+        _TEMPLATE_CACHE.move_to_end(path)
+        if len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_SIZE:
+            _TEMPLATE_CACHE.popitem(last=False)
+    return template
+
+
+def _compile_template(path: Path) -> Template:
+    """Read, import-resolve and compile a template file."""
     import ast
     import importlib.util
     import sys
     from hyper.templates.compiler import TemplateCompiler
     from hyper.templates.errors import TemplateCompileError
 
-    path = Path(path).resolve()
-    if not path.exists():
-        raise TemplateNotFoundError(f"Template file not found: {path}", path=path)
-
     # Read source code
     code = path.read_text()
 
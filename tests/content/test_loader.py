@@ -4,11 +4,16 @@ This file tests core functionality using only stdlib dataclasses.
 Library-specific tests (msgspec, pydantic) are in separate files.
 """
 
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import pytest
 
 from hyper import Collection, Singleton, load
+from hyper.content import converters, parsers
+from hyper.content.converters import dataclass as dataclass_converter
+from hyper.content.loader import _deep_merge_into
 
 
 @pytest.fixture
@@ -114,6 +119,50 @@ def test_bracket_syntax(content_dir):
     assert numbers == [1, 2, 3, 4, 5]
 
 
+def test_converter_registered_after_lookup_is_used(content_dir, monkeypatch):
+    """A converter added to CONVERTERS applies to types already converted once."""
+
+    @dataclass
+    class Settings:
+        theme: str
+        version: int
+
+    class UpperConverter:
+        @staticmethod
+        def can_convert(target_type):
+            return target_type is Settings
+
+        @staticmethod
+        def convert_single(data, target_type):
+            return target_type(data["theme"].upper(), data["version"])
+
+        @staticmethod
+        def convert_list(data, target_type):
+            return [UpperConverter.convert_single(item, target_type) for item in data]
+
+    monkeypatch.setattr(converters, "CONVERTERS", list(converters.CONVERTERS))
+
+    assert load("settings.json", Settings).theme == "dark"
+    converters.CONVERTERS.insert(0, UpperConverter)
+    assert load("settings.json", Settings).theme == "DARK"
+
+
+def test_dataclass_fields_cache_is_bounded(content_dir, monkeypatch):
+    """Field names aren't kept for every dataclass ever converted."""
+    monkeypatch.setattr(dataclass_converter, "_FIELDS_CACHE", {})
+    monkeypatch.setattr(dataclass_converter, "_FIELDS_CACHE_MAX", 2)
+
+    for _ in range(5):
+
+        @dataclass
+        class Settings:
+            theme: str
+            version: int
+
+        assert load("settings.json", Settings).theme == "dark"
+        assert len(dataclass_converter._FIELDS_CACHE) <= 2
+
+
 # ==========================================
 # Part 3: Multi-file merging
 # ==========================================
@@ -151,6 +200,74 @@ def test_merge_across_formats(content_dir):
     assert config.cache_enabled is True
 
 
+def test_deep_merge_into_merges_nested_dicts_in_place():
+    """Nested dicts are merged into the target's own dicts, not replaced."""
+    db = {"host": "localhost", "pool": {"min": 1, "max": 5}}
+    target = {"db": db, "debug": False}
+
+    _deep_merge_into(target, {"db": {"pool": {"max": 20}}, "debug": True})
+
+    assert target == {
+        "db": {"host": "localhost", "pool": {"min": 1, "max": 20}},
+        "debug": True,
+    }
+    assert target["db"] is db
+
+
+def test_deep_merge_into_merges_dict_subclasses():
+    """Dict subclasses (e.g. returned by hooks) are merged, not overwritten."""
+    target = {"db": OrderedDict(host="localhost", port=5432)}
+
+    _deep_merge_into(target, {"db": OrderedDict(port=6543)})
+
+    assert target == {"db": {"host": "localhost", "port": 6543}}
+
+
+def test_deep_merge_into_replaces_non_dict_values():
+    """A dict replaces a scalar and vice versa."""
+    target = {"a": 1, "b": {"c": 2}}
+
+    _deep_merge_into(target, {"a": {"x": 1}, "b": "flat"})
+
+    assert target == {"a": {"x": 1}, "b": "flat"}
+
+
+def test_deep_merge_into_handles_nesting_past_recursion_limit():
+    """The worklist merge has no recursion limit on nesting depth."""
+    depth = sys.getrecursionlimit() * 2
+
+    def nested(leaf):
+        node = leaf
+        for _ in range(depth):
+            node = {"child": node}
+        return node
+
+    target = nested({"keep": 1, "value": "old"})
+    _deep_merge_into(target, nested({"value": "new"}))
+
+    node = target
+    for _ in range(depth):
+        node = node["child"]
+    assert node == {"keep": 1, "value": "new"}
+
+
+def test_deep_merge_strategy_merges_nested_files(tmp_path, monkeypatch):
+    """merge="deep" merges nested sections across files, later files win."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "a.json").write_text(
+        '{"db": {"host": "localhost", "pool": {"min": 1, "max": 5}}}'
+    )
+    (tmp_path / "b.json").write_text('{"db": {"pool": {"max": 20}}}')
+
+    @dataclass
+    class Config:
+        db: dict
+
+    config = load("*.json", Config, merge="deep")
+
+    assert config.db == {"host": "localhost", "pool": {"min": 1, "max": 20}}
+
+
 # ==========================================
 # Part 4: Markdown with frontmatter
 # ==========================================
@@ -173,6 +290,23 @@ def test_load_markdown_frontmatter(content_dir):
     assert {p.id for p in posts} == {"blog/post-1", "blog/post-2"}  # Now includes path
 
 
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (b"---\ntitle: Hi\n---\nBody", {"title": "Hi", "body": "Body"}),
+        (b"------\nBody", {"body": "Body"}),
+        (b"---\ntitle: Hi\n---", {"title": "Hi", "body": ""}),
+        (b"---\nno closing delimiter", {"body": "---\nno closing delimiter"}),
+    ],
+)
+def test_markdown_frontmatter_delimiters(content, expected):
+    """Frontmatter ends at the next "---", so "------" is an empty block."""
+    data = parsers.MarkdownParser.parse(content)
+    data.pop("html")
+
+    assert data == expected
+
+
 # ==========================================
 # Part 5: Singleton and Collection classes
 # ==========================================
@@ -330,6 +464,43 @@ def test_unknown_file_extension(tmp_path, monkeypatch):
         load("data.xyz")
 
 
+class _LinesParser:
+    """Custom parser that claims *.lines.json files, not every .json file."""
+
+    @staticmethod
+    def can_parse(path):
+        return path.name.endswith(".lines.json")
+
+    @staticmethod
+    def parse(content, target_type=None):
+        return content.decode().splitlines()
+
+
+def test_custom_parser_ahead_of_builtins_sees_full_path(tmp_path, monkeypatch):
+    """A custom parser that looks past the suffix doesn't claim other files."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(parsers, "PARSERS", [_LinesParser, *parsers.PARSERS])
+    (tmp_path / "a.lines.json").write_text("one\ntwo")
+    (tmp_path / "b.json").write_text('{"k": 1}')
+
+    assert load("a.lines.json") == ["one", "two"]
+    assert load("b.json") == {"k": 1}
+    assert load("a.lines.json") == ["one", "two"]
+
+
+def test_parser_registered_after_lookup_is_used(tmp_path, monkeypatch):
+    """Adding a parser to PARSERS takes effect for suffixes already looked up."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(parsers, "PARSERS", list(parsers.PARSERS))
+    (tmp_path / "a.lines.json").write_text("one\ntwo")
+    (tmp_path / "b.json").write_text('{"k": 1}')
+
+    assert load("b.json") == {"k": 1}  # .json is now looked up
+    parsers.PARSERS.insert(0, _LinesParser)
+
+    assert load("a.lines.json") == ["one", "two"]
+
+
 def test_markdown_without_frontmatter_delimiters(tmp_path, monkeypatch):
     """Markdown without --- delimiters is treated as plain body with HTML."""
     monkeypatch.chdir(tmp_path)
@@ -1,5 +1,7 @@
 """Tests for Meta hooks: before_parse, after_parse, and after_load."""
 
+import threading
+
 import pytest
 from pathlib import Path
 
@@ -158,6 +160,39 @@ def test_after_parse_hook_collection(content_dir):
     assert posts[1].char_count == 11  # "Foo bar baz"
 
 
+def test_hooks_run_in_order_on_calling_thread(content_dir):
+    """Hooks are called one file at a time, in path order, on the caller's thread."""
+    posts_dir = content_dir / "posts"
+    posts_dir.mkdir()
+    for i in range(5):
+        (posts_dir / f"post{i}.json").write_text(f'{{"title": "Post {i}"}}')
+
+    calls = []
+
+    class Post(Collection):
+        title: str
+
+        class Meta:
+            pattern = "posts/*.json"
+
+            @staticmethod
+            def before_parse(path: Path, content: bytes) -> bytes:
+                calls.append(("before", path.name, threading.get_ident()))
+                return content
+
+            @staticmethod
+            def after_parse(path: Path, data: dict) -> dict:
+                calls.append(("after", path.name, threading.get_ident()))
+                return data
+
+    posts = Post.load()
+    assert [post.title for post in posts] == [f"Post {i}" for i in range(5)]
+    assert [(hook, name) for hook, name, _ in calls] == [
+        (hook, f"post{i}.json") for i in range(5) for hook in ("before", "after")
+    ]
+    assert {thread for _, _, thread in calls} == {threading.get_ident()}
+
+
 def test_after_parse_hook_field_transformation(content_dir):
     """after_parse can transform legacy field names."""
     (content_dir / "legacy.json").write_text(
@@ -3,6 +3,16 @@
 import pytest
 from pathlib import Path
 
+from hyper.templates._tdom import parser
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    """Start every test with an empty tdom parse cache."""
+    parser._PARSE_CACHE.clear()
+    yield
+    parser._PARSE_CACHE.clear()
+
 
 @pytest.fixture
 def component_dir(tmp_path: Path) -> Path:
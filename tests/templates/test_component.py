@@ -1,5 +1,10 @@
 """Tests for component loading and invocation."""
 
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from pathlib import Path
 
@@ -145,3 +150,139 @@ t"""<div class="wrapper">{...}</div>"""
 
         assert isinstance(result, Markup)
         assert "Content" in str(result)
+
+
+class TestTemplateCaching:
+    """Tests for in-memory and on-disk template caches."""
+
+    def test_load_template_reuses_unchanged_file(self, tmp_path: Path):
+        """Same Template instance until the file changes."""
+        path = tmp_path / "Badge.py"
+        path.write_text('t"""<span>new</span>"""')
+
+        first = load_template(path)
+        assert load_template(path) is first
+
+        path.write_text('t"""<span>updated</span>"""')
+        second = load_template(path)
+
+        assert second is not first
+        assert "updated" in str(second())
+
+    def test_load_template_reloads_when_only_mtime_changes(self, tmp_path: Path):
+        """A same-size edit is still picked up through the mtime."""
+        path = tmp_path / "Badge.py"
+        path.write_text('t"""<span>aaa</span>"""')
+        first = load_template(path)
+
+        path.write_text('t"""<span>bbb</span>"""')
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        second = load_template(path)
+
+        assert second is not first
+        assert "bbb" in str(second())
+
+    def test_load_template_cache_is_bounded(self, tmp_path: Path, monkeypatch):
+        """The least recently loaded template is dropped past the size cap."""
+        from hyper.templates import component as component_module
+
+        monkeypatch.setattr(component_module, "_TEMPLATE_CACHE", OrderedDict())
+        monkeypatch.setattr(component_module, "_TEMPLATE_CACHE_SIZE", 2)
+        paths = []
+        for name in ("A", "B", "C"):
+            paths.append(tmp_path / f"{name}.py")
+            paths[-1].write_text(f't"""<p>{name}</p>"""')
+
+        a = load_template(paths[0])
+        b = load_template(paths[1])
+        assert load_template(paths[0]) is a  # A is now the most recent
+        load_template(paths[2])  # Evicts B
+
+        assert load_template(paths[0]) is a
+        assert load_template(paths[1]) is not b
+
+    def test_concurrent_loads_with_eviction(self, tmp_path: Path, monkeypatch):
+        """Threads hitting and evicting the same small cache never raise."""
+        from hyper.templates import component as component_module
+
+        monkeypatch.setattr(component_module, "_TEMPLATE_CACHE", OrderedDict())
+        monkeypatch.setattr(component_module, "_TEMPLATE_CACHE_SIZE", 2)
+        paths = []
+        for i in range(6):
+            paths.append(tmp_path / f"T{i}.py")
+            paths[-1].write_text(f't"""<p>{i}</p>"""')
+
+        def load_all(_):
+            for _ in range(20):
+                for path in paths:
+                    load_template(path)
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(load_all, range(6)))
+
+        assert len(component_module._TEMPLATE_CACHE) == 2
+
+    def test_generated_code_cached_on_disk(self, tmp_path: Path, monkeypatch):
+        """A fresh load reuses the generated code from __pycache__."""
+        from hyper.templates import component as component_module
+
+        monkeypatch.setattr(sys, "dont_write_bytecode", False)
+        path = tmp_path / "Label.py"
+        path.write_text('''
+text: str = "Hi"
+
+t"""<label>{text}</label>"""
+''')
+
+        first = load_template(path)
+        assert list((tmp_path / "__pycache__").glob("Label.*.hyper"))
+
+        # Simulate a new process
+        component_module._TEMPLATE_CACHE.clear()
+        second = load_template(path)
+
+        assert second is not first
+        assert second.render_code == first.render_code
+        assert "Yo" in str(second(text="Yo"))
+
+    @pytest.mark.parametrize(
+        "body", [("only source",), 42, ("source", "not code"), b"\x00garbage"]
+    )
+    def test_malformed_disk_cache_is_a_miss(self, tmp_path: Path, monkeypatch, body):
+        """A cache file with a valid key but a bad body is recompiled, not trusted."""
+        import marshal
+
+        from hyper.templates import component as component_module
+
+        monkeypatch.setattr(sys, "dont_write_bytecode", False)
+        path = tmp_path / "Label.py"
+        path.write_text('t"""<label>Hi</label>"""')
+
+        load_template(path)
+        (cache_file,) = (tmp_path / "__pycache__").glob("Label.*.hyper")
+        key = cache_file.read_bytes()[:16]
+        raw = body if isinstance(body, bytes) else marshal.dumps(body)
+        cache_file.write_bytes(key + raw)
+
+        component_module._TEMPLATE_CACHE.clear()
+        assert "<label>Hi</label>" in str(load_template(path)())
+
+    @pytest.mark.parametrize(
+        "module", ["compiler.py", "loader.py", "_tdom/nodes.py", "_tdom/placeholders.py"]
+    )
+    def test_codegen_stamp_covers_generator_modules(self, module):
+        """Editing any module that shapes generated code invalidates the disk cache."""
+        from hyper.templates import compiler
+
+        module_file = Path(compiler.__file__).parent / module
+        st = module_file.stat()
+        compiler._codegen_stamp.cache_clear()
+        before = compiler._codegen_stamp()
+        try:
+            os.utime(module_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            compiler._codegen_stamp.cache_clear()
+            assert compiler._codegen_stamp() != before
+        finally:
+            os.utime(module_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+            compiler._codegen_stamp.cache_clear()
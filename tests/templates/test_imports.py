@@ -1,7 +1,9 @@
 """Test magic import system for templates."""
 
+import importlib.util
 from pathlib import Path
 import sys
+import types
 import pytest
 
 
@@ -14,11 +16,8 @@ def cleanup_modules():
 
     # Remove ALL template finders from meta_path (not just those we track)
     from hyper.templates import _enable_templates_instance, _TemplateFinder
-    # Clear the enabled modules set
-    _enable_templates_instance._enabled_modules.discard("templates")
-    # Remove finders for templates package
-    if "templates" in _enable_templates_instance._finders:
-        _enable_templates_instance._finders.pop("templates")
+    # Forget the templates package, so it can be enabled again
+    _enable_templates_instance._finders.pop("templates", None)
 
     # Remove any _TemplateFinder instances for templates
     to_remove_finders = [f for f in sys.meta_path if isinstance(f, _TemplateFinder) and f.package_name == "templates"]
@@ -157,3 +156,131 @@ t"""<div class="card">{...}</div>"""
         finally:
             sys.path.remove(str(tmp_path))
             cleanup_modules()
+
+
+class TestEnableTemplatesOptions:
+    """Test enable_templates(preload=..., exclude=...) and repeat calls."""
+
+    def test_preload_binds_every_template(self, tmp_path: Path):
+        """preload=True loads all templates up front, skipping excluded files."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+
+        (templates_dir / "Button.py").write_text('t"""<button>{...}</button>"""')
+        (templates_dir / "Card.py").write_text('t"""<div class="card">{...}</div>"""')
+        (templates_dir / "OldCard.py").write_text('t"""<div>{...}</div>"""')
+        (templates_dir / "__init__.py").write_text(
+            "from hyper import enable_templates\n"
+            'enable_templates(exclude=["Old*.py"], preload=True)\n'
+        )
+
+        sys.path.insert(0, str(tmp_path))
+
+        try:
+            import templates
+
+            assert callable(vars(templates)["Button"])
+            assert callable(vars(templates)["Card"])
+            assert "OldCard" not in vars(templates)
+
+        finally:
+            sys.path.remove(str(tmp_path))
+            cleanup_modules()
+
+    def test_repeat_call_applies_new_exclude(self, tmp_path: Path):
+        """A follow-up enable_templates(exclude=...) hides templates from imports."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+
+        (templates_dir / "Button.py").write_text('t"""<button>{...}</button>"""')
+        (templates_dir / "OldButton.py").write_text('t"""<button>{...}</button>"""')
+        (templates_dir / "__init__.py").write_text(
+            "from hyper import enable_templates"
+        )
+
+        sys.path.insert(0, str(tmp_path))
+
+        try:
+            import templates
+
+            # Found before the exclude, so that lookup must not stay cached
+            assert importlib.util.find_spec("templates.OldButton") is not None
+
+            exec(
+                'from hyper import enable_templates\n'
+                'enable_templates(exclude=["Old*.py"])',
+                vars(templates),
+            )
+
+            from templates import Button
+
+            assert callable(Button)
+            with pytest.raises(AttributeError):
+                getattr(templates, "OldButton")
+            # Excluded files are left to the regular import system
+            from templates import OldButton
+
+            assert isinstance(OldButton, types.ModuleType)
+
+        finally:
+            sys.path.remove(str(tmp_path))
+            cleanup_modules()
+
+    def test_repeat_import_does_not_rescan(self, tmp_path: Path):
+        """Importing enable_templates again in an enabled package is cheap."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+
+        (templates_dir / "Button.py").write_text('t"""<button>{...}</button>"""')
+        (templates_dir / "__init__.py").write_text(
+            "from hyper import enable_templates"
+        )
+
+        sys.path.insert(0, str(tmp_path))
+
+        try:
+            import templates
+            from hyper.templates import _enable_templates_instance
+
+            finder = _enable_templates_instance._finders["templates"]
+            scans = []
+            finder.invalidate_caches = lambda: scans.append(1)
+
+            exec("from hyper import enable_templates", vars(templates))
+            exec("from hyper import enable_templates", vars(templates))
+
+            assert scans == []
+
+        finally:
+            sys.path.remove(str(tmp_path))
+            cleanup_modules()
+
+    def test_created_and_deleted_templates(self, tmp_path: Path):
+        """The finder notices new and deleted template files."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+
+        (templates_dir / "Button.py").write_text('t"""<button>{...}</button>"""')
+        (templates_dir / "__init__.py").write_text(
+            "from hyper import enable_templates"
+        )
+
+        sys.path.insert(0, str(tmp_path))
+
+        try:
+            import templates  # noqa: F401
+
+            assert importlib.util.find_spec("templates.Button") is not None
+            assert importlib.util.find_spec("templates.Card") is None
+
+            # A cached spec is not reused once its file is gone
+            (templates_dir / "Button.py").unlink()
+            assert importlib.util.find_spec("templates.Button") is None
+
+            (templates_dir / "Card.py").write_text('t"""<div>{...}</div>"""')
+            importlib.invalidate_caches()
+            assert importlib.util.find_spec("templates.Card") is not None
+
+        finally:
+            sys.path.remove(str(tmp_path))
+            cleanup_modules()
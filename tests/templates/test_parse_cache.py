@@ -0,0 +1,76 @@
+"""Test the tdom parse cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+from string.templatelib import Interpolation, Template
+
+from hyper.templates._tdom import parser
+from hyper.templates._tdom.parser import parse_html
+
+
+def test_same_strings_hit_cache():
+    """A t-string evaluated twice is parsed once."""
+
+    def render(name):
+        return t"<p>Hello, {name}!</p>"
+
+    first = parse_html(render("a"))
+    second = parse_html(render("b"))
+
+    assert second is first
+    assert len(parser._PARSE_CACHE) == 1
+
+
+def test_equal_strings_hit_cache():
+    """Templates built separately with equal strings share a parse."""
+    first = parse_html(Template("<p>", Interpolation("a", "x"), "</p>"))
+    second = parse_html(Template("<p>", Interpolation("b", "x"), "</p>"))
+
+    assert second is first
+
+
+def test_different_strings_parse_separately():
+    first = parse_html(t"<p>a</p>")
+    second = parse_html(t"<div>b</div>")
+
+    assert second is not first
+    assert len(parser._PARSE_CACHE) == 2
+
+
+def test_least_recently_used_is_evicted(monkeypatch):
+    monkeypatch.setattr(parser, "_PARSE_CACHE_SIZE", 2)
+    a, b, c = t"<a></a>", t"<b></b>", t"<i></i>"
+
+    parsed_a = parse_html(a)
+    parse_html(b)
+    assert parse_html(a) is parsed_a  # a is now the most recently used
+    parse_html(c)
+
+    assert list(parser._PARSE_CACHE) == [a.strings, c.strings]
+    assert parse_html(a) is parsed_a
+
+
+def test_concurrent_parses_with_eviction(monkeypatch):
+    """Threads hitting and evicting the same small cache never raise."""
+    monkeypatch.setattr(parser, "_PARSE_CACHE_SIZE", 2)
+    templates = [Template(f"<p>{i}</p>") for i in range(8)]
+
+    def parse_all(_):
+        for _ in range(200):
+            for template in templates:
+                assert parse_html(template).tag == "p"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(parse_all, range(8)))
+
+    assert len(parser._PARSE_CACHE) == 2
+
+
+def test_reused_strings_tuple_hits_cache():
+    """Every evaluation of a literal returns the tree from the first parse."""
+    templates = [t"<li>{i}</li>" for i in range(3)]
+    first = parse_html(templates[0])
+
+    for template in templates[1:]:
+        assert parse_html(template) is first
+    assert list(parser._PARSE_CACHE) == [templates[0].strings]
+